@@ -17,8 +17,11 @@ __all__ = [
     # Encoder
     "jonx_encode",
     "encode_to_bytes",
+    "train_jonx_dict",
+    "compile_encoder",
     # Decoder
     "decode_from_bytes",
+    "decode_columns_from_bytes",
     "JONXFile",
     #Type
     "detect_type",
@@ -3,9 +3,11 @@ Interface en ligne de commande (CLI) pour jsonplusplus.
 """
 
 import argparse
-import json
 import sys
 import os
+import gzip
+import orjson
+import zstandard as zstd
 from pathlib import Path
 from . import (
     jonx_encode,
@@ -19,6 +21,28 @@ from . import (
     JONXFileError
 )
 
+# Compression rapide pour les sorties JSON décodées (.zst / .gz)
+JSON_ZSTD = zstd.ZstdCompressor(level=3)
+
+
+def _compress_json_output(payload, output_path):
+    """
+    Compresse le JSON décodé selon l'extension du fichier de sortie.
+
+    Args:
+        payload: JSON sérialisé (bytes)
+        output_path: Chemin du fichier de sortie
+
+    Returns:
+        bytes: Données à écrire (compressées en zstd pour .zst, gzip pour .gz)
+    """
+    suffix = Path(output_path).suffix.lower()
+    if suffix == ".zst":
+        return JSON_ZSTD.compress(payload)
+    if suffix == ".gz":
+        return gzip.compress(payload, compresslevel=6)
+    return payload
+
 
 def cmd_encode(args):
     """Commande pour encoder JSON → JONX"""
@@ -79,10 +103,13 @@ def cmd_decode(args):
             jonx_bytes = f.read()
         
         result = decode_from_bytes(jonx_bytes)
+        # Les bytes JONX ne sont plus nécessaires pendant l'écriture du JSON
+        del jonx_bytes
         
-        # Écrire le JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result["json_data"], f, indent=2, ensure_ascii=False)
+        # Écrire le JSON (orjson sérialise aussi date, datetime et UUID)
+        payload = orjson.dumps(result["json_data"], option=orjson.OPT_INDENT_2)
+        with open(output_path, 'wb') as f:
+            f.write(_compress_json_output(payload, output_path))
         
         print(f"✅ Décodage réussi!")
         print(f"   Version: {result['version']}")
@@ -256,6 +283,7 @@ Exemples:
   
   # Décoder un fichier JONX
   jsonplusplus decode data.jonx -o data.json
+  jsonplusplus decode data.jonx -o data.json.zst   # sortie compressée (.zst ou .gz)
   
   # Afficher les informations
   jsonplusplus info data.jonx
@@ -284,7 +312,8 @@ Exemples:
     # Commande decode
     decode_parser = subparsers.add_parser("decode", help="Décoder JONX → JSON")
     decode_parser.add_argument("input", help="Fichier JONX d'entrée")
-    decode_parser.add_argument("-o", "--output", help="Fichier JSON de sortie (optionnel)")
+    decode_parser.add_argument("-o", "--output",
+                               help="Fichier JSON de sortie (optionnel, compressé si .zst ou .gz)")
     decode_parser.set_defaults(func=cmd_decode)
     
     # Commande info
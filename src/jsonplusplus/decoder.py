@@ -1,9 +1,23 @@
 import orjson
 import zstandard as zstd
-import struct
 import numpy as np
 import os
-from .utils.decoder import decode_from_bytes
+import mmap
+from .utils.decoder import (
+    _make_decompressor,
+    _decompress_error,
+    _read_header_and_schema,
+    _locate_columns,
+    _locate_indexes,
+    _split_blob,
+    _decode_bool_column,
+    _bool_bit_count,
+    _inline_dictionary_fields,
+    _decode_dictionary_column,
+    _unpack_blob,
+    _decode_delta_index,
+    _check_dictionary,
+)
 
 
 from .exceptions import (
@@ -20,6 +34,29 @@ NUMERIC_TYPES = {
     "float16", "float32", "float64"
 }
 
+# Mapping des types numériques vers leurs dtypes numpy
+NUMERIC_DTYPES = {
+    "int8": np.int8,
+    "int16": np.int16,
+    "int32": np.int32,
+    "int64": np.int64,
+    "uint8": np.uint8,
+    "uint16": np.uint16,
+    "uint32": np.uint32,
+    "uint64": np.uint64,
+    "float16": np.float16,
+    "float32": np.float32,
+    "float64": np.float64,
+}
+
+# Largeur en octets des types stockés à taille fixe
+FIXED_WIDTH_TYPES = {
+    "int8": 1, "int16": 2, "int32": 4, "int64": 8,
+    "uint8": 1, "uint16": 2, "uint32": 4, "uint64": 8,
+    "float16": 2, "float32": 4, "float64": 8,
+    "bool": 1
+}
+
 # Tous les types supportés
 SUPPORTED_TYPES = NUMERIC_TYPES | {
     "bool", "str", "json", "binary",
@@ -28,13 +65,19 @@ SUPPORTED_TYPES = NUMERIC_TYPES | {
 }
 
 
+def _to_python(value):
+    """Convertit un scalaire numpy en scalaire Python natif."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
 class JONXFile:
-    def __init__(self, path):
+    def __init__(self, path, dict_data=None):
         """
         Initialise un objet JONXFile pour accéder à un fichier JONX.
         
         Args:
             path: Chemin vers le fichier JONX
+            dict_data: Dictionnaire zstd utilisé à l'encodage (optionnel)
             
         Raises:
             JONXFileError: Si le fichier ne peut pas être lu
@@ -65,70 +108,114 @@ class JONXFile:
             )
         
         self.path = path
+        self.version = None
+        self._mm = None
+        self.dict_data = dict_data
+        # Un décompresseur par fichier, réutilisé à chaque accès : les
+        # ZstdDecompressor ne supportent pas les appels concurrents
+        self._dctx = _make_decompressor(dict_data)
         self.fields = []
         self.types = {}
         self.compressed_columns = {}
         self.indexes = {}
+        self.index_format = "json"
+        self.num_rows = None
+        self._bool_bits = None
+        self._inline_dicts = set()
+        self._col_cache = {}
         self._load_file()
 
     def _load_file(self):
+        # Fichier projeté en mémoire : seules les pages des colonnes
+        # effectivement lues sont chargées par l'OS
         try:
             with open(self.path, "rb") as f:
-                data = f.read()
-        except IOError as e:
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size > 0:
+                    self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, ValueError) as e:
             raise JONXFileError(
                 f"Impossible de lire le fichier: {self.path}",
                 {"path": self.path, "error": str(e)}
             ) from e
         
-        if len(data) == 0:
+        if file_size == 0:
             raise JONXFileError(
                 f"Le fichier est vide: {self.path}",
                 {"path": self.path}
             )
 
+        data = memoryview(self._mm)
+
+        # Seuls l'en-tête et le schéma sont décodés : les colonnes restent
+        # compressées jusqu'au premier accès
         try:
-            result = decode_from_bytes(data)
-            self.fields = result["fields"]
-            self.types = result["types"]
+            self.version, schema, offset = _read_header_and_schema(data, self._dctx)
+            _check_dictionary(schema, self.dict_data)
+            self.fields = schema["fields"]
+            self.types = schema["types"]
+            # Anciens fichiers : index sérialisés en JSON
+            self.index_format = schema.get("index_format", "json")
+            # Nombre de lignes inscrit dans le schéma (fichiers récents)
+            self.num_rows = schema.get("num_rows")
+            self._bool_bits = _bool_bit_count(schema)
+            self._inline_dicts = _inline_dictionary_fields(schema)
+
+            # Les colonnes et index sont conservés comme vues sur le fichier, sans copie
+            frames, offset = _locate_columns(data, self.fields, offset)
+            self.compressed_columns = dict(zip(self.fields, frames))
+            self.indexes, offset = _locate_indexes(data, offset, self.version)
         except (JONXDecodeError, JONXValidationError) as e:
             # Ajouter le chemin du fichier aux détails
             if hasattr(e, 'details'):
                 e.details['file_path'] = self.path
             raise
 
-        if not data.startswith(b"JONX"):
-            raise JONXDecodeError(
-                f"Le fichier n'est pas au format JONX: {self.path}",
-                {"path": self.path}
-            )
+    def close(self):
+        """
+        Libère les vues sur le fichier et ferme la projection mémoire.
 
-        offset = 8
+        Les colonnes ne sont plus accessibles après la fermeture.
+        """
+        self.compressed_columns = {}
+        self.indexes = {}
+        self._col_cache = {}
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                # Des vues sont encore référencées ailleurs : le GC s'en chargera
+                return
+            self._mm = None
 
-        schema_size = struct.unpack("I", data[offset:offset + 4])[0]
-        offset += 4 + schema_size
+    def __del__(self):
+        if getattr(self, "_mm", None) is not None:
+            self.close()
 
-        # --- Colonnes compressées ---
-        for field in self.fields:
-            col_size = struct.unpack("I", data[offset:offset + 4])[0]
-            offset += 4
-            self.compressed_columns[field] = data[offset:offset + col_size]
-            offset += col_size
-
-        # --- Index compressés ---
-        num_indexes = struct.unpack("I", data[offset:offset + 4])[0]
-        offset += 4
-
-        for _ in range(num_indexes):
-            name_len = struct.unpack("I", data[offset:offset + 4])[0]
-            offset += 4
-            name = data[offset:offset + name_len].decode()
-            offset += name_len
-
-            idx_size = struct.unpack("I", data[offset:offset + 4])[0]
-            offset += 4
-            self.indexes[name] = data[offset:offset + idx_size]
-            offset += idx_size
+    def _read_index(self, field_name):
+        """
+        Décompresse et décode l'index de tri d'une colonne.
+
+        Args:
+            field_name: Nom de la colonne indexée
+
+        Returns:
+            np.ndarray ou list: Positions des lignes triées par valeur croissante
+
+        Raises:
+            JONXIndexError: Si le contenu de l'index est invalide
+        """
+        raw = _unpack_blob(self._dctx, self.indexes[field_name], self.version)
+        if self.index_format == "delta":
+            return _decode_delta_index(raw, field_name)
+        if self.index_format == "json":
+            # Anciens fichiers : positions sérialisées en JSON
+            return orjson.loads(raw)
+
+        raise JONXIndexError(
+            f"Format d'index inconnu: {self.index_format}",
+            {"field": field_name, "index_format": self.index_format}
+        )
 
     def _validate_field_name(self, field_name):
         """
@@ -179,50 +266,35 @@ class JONXFile:
                 {"field": field_name, "type": col_type}
             )
 
-    def _decompress_column(self, field_name, compressed):
+    def _decompress_frame(self, field_name, compressed):
+        is_zstd, payload = _split_blob(compressed, self.version)
+        if not is_zstd:
+            return payload
         try:
-            packed = zstd.ZstdDecompressor().decompress(compressed)
+            return self._dctx.decompress(payload)
         except zstd.ZstdError as e:
-            raise JONXDecodeError(
-                f"Erreur lors de la décompression de la colonne '{field_name}'",
-                {"field": field_name, "error": str(e)}
-            ) from e
+            raise _decompress_error(field_name, payload, e) from e
 
+    def _decompress_column(self, field_name, compressed):
+        packed = self._decompress_frame(field_name, compressed)
         t = self.types[field_name]
 
-        # Mapping des types numériques vers leurs formats struct
-        numeric_formats = {
-            "int8": ("b", 1),
-            "int16": ("h", 2),
-            "int32": ("i", 4),
-            "int64": ("q", 8),
-            "uint8": ("B", 1),
-            "uint16": ("H", 2),
-            "uint32": ("I", 4),
-            "uint64": ("Q", 8),
-            "float32": ("f", 4),
-            "float64": ("d", 8),
-        }
-
         try:
-            # Types numériques standards
-            if t in numeric_formats:
-                fmt, size = numeric_formats[t]
-                n = len(packed) // size
-                return list(struct.unpack(f"{n}{fmt}", packed))
-
-            # float16 nécessite numpy
-            if t == "float16":
-                arr = np.frombuffer(packed, dtype=np.float16)
-                return arr.astype(np.float32).tolist()
+            # Types numériques : tableau numpy (vue sur les données décompressées)
+            if t in NUMERIC_DTYPES:
+                return np.frombuffer(packed, dtype=NUMERIC_DTYPES[t])
 
             # bool
             if t == "bool":
-                return [bool(b) for b in packed]
+                return _decode_bool_column(packed, field_name, self._bool_bits)
+
+            # enum / string_dict avec dictionnaire embarqué
+            if field_name in self._inline_dicts:
+                return _decode_dictionary_column(packed, field_name)
 
             # Tous les autres types (str, json, uuid, date, datetime, enum, string_dict, binary, etc.)
             return orjson.loads(packed)
-        except (struct.error, orjson.JSONDecodeError) as e:
+        except (ValueError, orjson.JSONDecodeError) as e:
             raise JONXDecodeError(
                 f"Erreur lors du décodage de la colonne '{field_name}'",
                 {"field": field_name, "type": t, "error": str(e)}
@@ -231,12 +303,17 @@ class JONXFile:
     def get_column(self, field_name):
         """
         Récupère une colonne décompressée avec validation.
+
+        La colonne est décompressée au premier accès puis mise en cache :
+        la valeur retournée est partagée entre les appels et ne doit pas
+        être modifiée.
         
         Args:
             field_name: Nom de la colonne
             
         Returns:
-            list: Liste des valeurs de la colonne
+            list ou np.ndarray: Valeurs de la colonne (tableau numpy en
+            lecture seule pour les types numériques)
             
         Raises:
             JONXValidationError: Si la colonne n'existe pas
@@ -250,7 +327,11 @@ class JONXFile:
                 {"field": field_name, "available_columns": list(self.compressed_columns.keys())}
             )
         
-        return self._decompress_column(field_name, self.compressed_columns[field_name])
+        column = self._col_cache.get(field_name)
+        if column is None:
+            column = self._decompress_column(field_name, self.compressed_columns[field_name])
+            self._col_cache[field_name] = column
+        return column
 
     def find_min(self, field, column=None, use_index=False):
         """
@@ -286,19 +367,21 @@ class JONXFile:
                     {"field": field, "available_indexes": list(self.indexes.keys())}
                 )
             try:
-                idx = orjson.loads(zstd.ZstdDecompressor().decompress(self.indexes[field]))
+                idx = self._read_index(field)
                 if len(idx) == 0:
                     raise JONXIndexError(
                         f"L'index pour la colonne '{field}' est vide",
                         {"field": field}
                     )
-                return column[idx[0]]
+                return _to_python(column[idx[0]])
             except (zstd.ZstdError, orjson.JSONDecodeError) as e:
                 raise JONXIndexError(
                     f"Erreur lors de la lecture de l'index pour '{field}'",
                     {"field": field, "error": str(e)}
                 ) from e
         
+        if isinstance(column, np.ndarray):
+            return column.min().item()
         return min(column)
 
     def find_max(self, field, column=None, use_index=False):
@@ -335,19 +418,21 @@ class JONXFile:
                     {"field": field, "available_indexes": list(self.indexes.keys())}
                 )
             try:
-                idx = orjson.loads(zstd.ZstdDecompressor().decompress(self.indexes[field]))
+                idx = self._read_index(field)
                 if len(idx) == 0:
                     raise JONXIndexError(
                         f"L'index pour la colonne '{field}' est vide",
                         {"field": field}
                     )
-                return column[idx[-1]]  # Dernier élément de l'index trié = maximum
+                return _to_python(column[idx[-1]])  # Dernier élément de l'index trié = maximum
             except (zstd.ZstdError, orjson.JSONDecodeError) as e:
                 raise JONXIndexError(
                     f"Erreur lors de la lecture de l'index pour '{field}'",
                     {"field": field, "error": str(e)}
                 ) from e
         
+        if isinstance(column, np.ndarray):
+            return column.max().item()
         return max(column)
 
     def sum(self, field, column=None):
@@ -375,6 +460,12 @@ class JONXFile:
                 {"field": field}
             )
         
+        if isinstance(column, np.ndarray):
+            if column.dtype.kind == "f":
+                # Accumulation en float64 pour éviter tout débordement du dtype stocké
+                return column.sum(dtype=np.float64).item()
+            # Entiers : somme exacte en entiers Python (int64 / uint64 déborderaient)
+            return sum(column.tolist())
         return sum(column)
 
     def avg(self, field, column=None):
@@ -402,6 +493,8 @@ class JONXFile:
                 {"field": field}
             )
         
+        if isinstance(column, np.ndarray):
+            return column.mean(dtype=np.float64).item()
         return sum(column) / len(column)
 
     def count(self, field=None):
@@ -421,11 +514,54 @@ class JONXFile:
             # Retourne le nombre total de lignes
             if len(self.fields) == 0:
                 return 0
+            if self.num_rows is not None:
+                return self.num_rows
+            # Une colonne à largeur fixe suffit : pas besoin de décompresser
+            for name in self.fields:
+                num_rows = self._count_from_frame(name)
+                if num_rows is not None:
+                    return num_rows
             return len(self.get_column(self.fields[0]))
         
         self._validate_field_name(field)
+        if self.num_rows is not None:
+            return self.num_rows
+        num_rows = self._count_from_frame(field)
+        if num_rows is not None:
+            return num_rows
         return len(self.get_column(field))
 
+    def _count_from_frame(self, field):
+        """
+        Calcule le nombre de valeurs d'une colonne à largeur fixe sans la
+        décompresser, à partir de la taille décompressée inscrite dans
+        l'en-tête de la trame zstd (ou de la taille du blob s'il est brut).
+
+        Args:
+            field: Nom de la colonne
+
+        Returns:
+            int ou None: Nombre de valeurs, ou None si la colonne n'est pas
+            à largeur fixe ou si la taille n'est pas connue
+        """
+        col_type = self.types.get(field)
+        width = FIXED_WIDTH_TYPES.get(col_type)
+        if col_type == "bool" and self._bool_bits is not None:
+            # Packé à 1 bit par valeur : la taille ne donne pas le compte exact
+            return None
+        if width is None or field not in self.compressed_columns:
+            return None
+
+        try:
+            is_zstd, payload = _split_blob(self.compressed_columns[field], self.version)
+            content_size = zstd.frame_content_size(payload) if is_zstd else len(payload)
+        except (zstd.ZstdError, JONXDecodeError):
+            return None
+
+        if content_size < 0 or content_size % width != 0:
+            return None
+        return content_size // width
+
     def get_columns(self, field_names):
         """
         Récupère plusieurs colonnes en une seule opération.
@@ -483,7 +619,7 @@ class JONXFile:
         
         return {
             "path": self.path,
-            "version": 1,  # Version actuelle du format
+            "version": self.version,
             "num_rows": self.count() if len(self.fields) > 0 else 0,
             "num_columns": len(self.fields),
             "fields": self.fields.copy(),
@@ -648,7 +784,7 @@ class JONXFile:
         # 4. Vérifier que tous les index peuvent être lus
         for index_field in self.indexes.keys():
             try:
-                idx = orjson.loads(zstd.ZstdDecompressor().decompress(self.indexes[index_field]))
+                idx = self._read_index(index_field)
                 if len(idx) == 0:
                     warnings.append(f"L'index pour '{index_field}' est vide")
                 elif len(idx) != self.count():
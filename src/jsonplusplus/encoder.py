@@ -5,11 +5,103 @@ from .exceptions import (
     JONXValidationError,
     JONXEncodeError,
     JONXFileError,
+    JONXSchemaError,
 )
-from .utils.encoder import encode_to_bytes
+from .utils.encoder import encode_to_bytes, encode_columns_to_bytes
+
+try:
+    import ijson
+except ImportError:  # Dépendance optionnelle : pip install jsonplusplus[stream]
+    ijson = None
 
 ZSTD = zstd.ZstdCompressor(level=7)
 
+# Au-delà de cette taille, le JSON est lu en flux (si ijson est installé) :
+# en dessous, orjson.loads est plus rapide et la mémoire n'est pas un souci
+STREAMING_MIN_BYTES = 50 * 1024 * 1024
+
+# Premier événement ijson -> type Python de la racine (messages d'erreur)
+JSON_ROOT_TYPES = {
+    "start_map": "dict",
+    "string": "str",
+    "number": "float",
+    "boolean": "bool",
+    "null": "NoneType",
+}
+
+
+def _read_columns_streaming(json_path):
+    """
+    Lit un fichier JSON (liste d'objets) en flux et remplit directement les
+    colonnes, sans jamais construire la liste d'objets complète.
+
+    Args:
+        json_path: Chemin vers le fichier JSON source
+
+    Returns:
+        tuple: (fields, columns) avec columns un dictionnaire {nom: valeurs}
+
+    Raises:
+        JONXValidationError: Si les données JSON sont invalides
+        JONXSchemaError: Si un objet n'a pas les mêmes clés que le premier
+    """
+    fields = None
+    with open(json_path, "rb") as f:
+        # ijson.items(f, "item") accepterait aussi {"item": ...} : la racine
+        # doit être une liste, comme pour la lecture en mémoire
+        _, event, _ = next(ijson.parse(f))
+        if event != "start_array":
+            raise JONXValidationError(
+                "Les données JSON doivent être une liste d'objets",
+                {"type": JSON_ROOT_TYPES.get(event, event)}
+            )
+        f.seek(0)
+
+        for i, row in enumerate(ijson.items(f, "item", use_float=True)):
+            if not isinstance(row, dict):
+                raise JONXValidationError(
+                    f"L'élément à l'index {i} n'est pas un dictionnaire",
+                    {"index": i, "type": type(row).__name__}
+                )
+
+            if fields is None:
+                fields = list(row.keys())
+                if not fields:
+                    raise JONXValidationError(
+                        "Les objets JSON doivent avoir au moins une clé",
+                        {"index": i}
+                    )
+                first_keys = set(fields)
+                columns = {field: [] for field in fields}
+                appenders = [(field, columns[field].append) for field in fields]
+
+            elif row.keys() != first_keys:
+                item_keys = set(row.keys())
+                missing = first_keys - item_keys
+                extra = item_keys - first_keys
+                raise JONXSchemaError(
+                    f"L'objet à l'index {i} a un schéma différent",
+                    {
+                        "index": i,
+                        "expected_keys": sorted(first_keys),
+                        "actual_keys": sorted(item_keys),
+                        "missing_keys": sorted(missing) if missing else None,
+                        "extra_keys": sorted(extra) if extra else None
+                    }
+                )
+
+            for field, append in appenders:
+                append(row[field])
+
+    if fields is None:
+        raise JONXValidationError(
+            "La liste JSON ne peut pas être vide",
+            {"path": json_path, "num_rows": 0}
+        )
+
+    return fields, columns
+
+
 # -----------------------------------------------------
 #   WRAPPER FICHIER
 # -----------------------------------------------------
@@ -47,6 +139,45 @@ def jonx_encode(json_path, jonx_path):
             {"path": json_path}
         )
     
+    # Gros fichiers : lecture en flux, colonne par colonne
+    if ijson is not None and os.path.getsize(json_path) >= STREAMING_MIN_BYTES:
+        try:
+            fields, columns = _read_columns_streaming(json_path)
+            num_rows, num_columns = len(columns[fields[0]]), len(fields)
+            jonx_bytes = encode_columns_to_bytes(fields, columns)
+        except ijson.JSONError as e:
+            raise JONXValidationError(
+                f"Le fichier JSON est invalide: {json_path}",
+                {"path": json_path, "error": str(e)}
+            ) from e
+        except IOError as e:
+            raise JONXFileError(
+                f"Impossible de lire le fichier: {json_path}",
+                {"path": json_path, "error": str(e)}
+            ) from e
+        except (JONXValidationError, JONXEncodeError) as e:
+            if hasattr(e, 'details'):
+                e.details['source_file'] = json_path
+            raise
+        del columns
+    else:
+        jonx_bytes, num_rows, num_columns = _encode_in_memory(json_path)
+
+    _write_jonx(jonx_bytes, jonx_path)
+
+    print(f"✅ JONX créé : {num_rows} lignes, {num_columns} colonnes")
+
+
+def _encode_in_memory(json_path):
+    """
+    Lit le fichier JSON en entier avec orjson puis l'encode.
+
+    Args:
+        json_path: Chemin vers le fichier JSON source
+
+    Returns:
+        tuple: (jonx_bytes, nombre de lignes, nombre de colonnes)
+    """
     # Lire et parser le fichier JSON
     try:
         with open(json_path, "rb") as f:
@@ -76,6 +207,9 @@ def jonx_encode(json_path, jonx_path):
             {"path": json_path, "error": str(e)}
         ) from e
     
+    # Libérer le texte brut avant l'encodage pour ne pas doubler le pic mémoire
+    del file_content
+    
     # Encoder les données
     try:
         jonx_bytes = encode_to_bytes(data)
@@ -84,8 +218,18 @@ def jonx_encode(json_path, jonx_path):
         if hasattr(e, 'details'):
             e.details['source_file'] = json_path
         raise
-    
-    # Écrire le fichier JONX
+
+    return jonx_bytes, len(data), len(data[0])
+
+
+def _write_jonx(jonx_bytes, jonx_path):
+    """
+    Écrit les bytes JONX sur disque, en créant le répertoire si nécessaire.
+
+    Args:
+        jonx_bytes: Données JONX encodées
+        jonx_path: Chemin du fichier JONX de destination
+    """
     try:
         # Créer le répertoire de destination si nécessaire
         dest_dir = os.path.dirname(jonx_path)
@@ -99,5 +243,3 @@ def jonx_encode(json_path, jonx_path):
             f"Impossible d'écrire le fichier JONX: {jonx_path}",
             {"path": jonx_path, "error": str(e)}
         ) from e
-    
-    print(f"✅ JONX créé : {len(data)} lignes, {len(data[0])} colonnes")
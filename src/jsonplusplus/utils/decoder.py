@@ -8,21 +8,48 @@ from ..exceptions import (
     JONXDecodeError,
     JONXSchemaError,
     JONXValidationError,
+    JONXIndexError,
 )
+from .packing import dictionary_code_dtype
+
+# Préfixes de longueur : uint32 little-endian
+_U32 = struct.Struct("<I")
+
+# Versions de format lisibles (la v4 n'a jamais été publiée). À partir de
+# la v5, la section des index est précédée de sa taille totale et chaque
+# blob (schéma, colonne, index) commence par un octet indiquant s'il est
+# compressé en zstd ou stocké brut
+SUPPORTED_VERSIONS = (1, 2, 3, 5)
+INDEX_SECTION_SIZE_VERSION = 5
+BLOB_FLAG_VERSION = 5
+BLOB_RAW = 0
+BLOB_ZSTD = 1
+
+# Index au format "delta" : octet de codage -> dtype des données stockées
+# (positions int32 brutes, ou deltas uint8 à cumuler pour une colonne triée)
+INDEX_RAW_I32 = 0
+INDEX_CODEC_DTYPES = {
+    INDEX_RAW_I32: np.dtype("<i4"),
+    1: np.dtype("<u1"),
+}
+
+# Taille compressée totale à partir de laquelle les colonnes sont
+# décompressées en parallèle (en dessous, le coût des threads domine)
+PARALLEL_DECOMPRESS_MIN_BYTES = 1 << 20
 
-# Types numériques et leurs formats struct
+# Types numériques et leurs dtypes numpy
 NUMERIC_TYPES = {
-    "int8": ("b", 1),  # signed char
-    "int16": ("h", 2),  # signed short
-    "int32": ("i", 4),  # signed int
-    "int64": ("q", 8),  # signed long long
-    "uint8": ("B", 1),  # unsigned char
-    "uint16": ("H", 2),  # unsigned short
-    "uint32": ("I", 4),  # unsigned int
-    "uint64": ("Q", 8),  # unsigned long long
-    "float16": (None, 2),  # numpy float16
-    "float32": ("f", 4),  # float
-    "float64": ("d", 8),  # double
+    "int8": (np.int8, 1),  # signed char
+    "int16": (np.int16, 2),  # signed short
+    "int32": (np.int32, 4),  # signed int
+    "int64": (np.int64, 8),  # signed long long
+    "uint8": (np.uint8, 1),  # unsigned char
+    "uint16": (np.uint16, 2),  # unsigned short
+    "uint32": (np.uint32, 4),  # unsigned int
+    "uint64": (np.uint64, 8),  # unsigned long long
+    "float16": (np.float16, 2),  # half float
+    "float32": (np.float32, 4),  # float
+    "float64": (np.float64, 8),  # double
 }
 
 
@@ -52,7 +79,7 @@ def _decode_numeric_column(packed, col_type, field):
         field: Nom du champ (pour les messages d'erreur)
 
     Returns:
-        list: Valeurs décodées
+        np.ndarray: Valeurs décodées (vue en lecture seule sur ``packed``)
     """
     if col_type not in NUMERIC_TYPES:
         raise JONXDecodeError(
@@ -60,7 +87,7 @@ def _decode_numeric_column(packed, col_type, field):
             {"field": field, "type": col_type}
         )
 
-    format_char, size = NUMERIC_TYPES[col_type]
+    dtype, size = NUMERIC_TYPES[col_type]
 
     if len(packed) % size != 0:
         raise JONXDecodeError(
@@ -68,22 +95,184 @@ def _decode_numeric_column(packed, col_type, field):
             {"field": field, "packed_size": len(packed), "expected_multiple": size}
         )
 
-    n = len(packed) // size
-
-    # float16 nécessite numpy
-    if col_type == "float16":
-        arr = np.frombuffer(packed, dtype=np.float16)
-        return arr.astype(np.float32).tolist()
-
-    # Autres types numériques
     try:
-        return list(struct.unpack(f"{n}{format_char}", packed))
-    except struct.error as e:
+        arr = np.frombuffer(packed, dtype=dtype)
+    except ValueError as e:
         raise JONXDecodeError(
             f"Erreur lors du décodage binaire de la colonne '{field}'",
             {"field": field, "type": col_type, "error": str(e)}
         ) from e
 
+    return arr
+
+
+def _decode_bool_column(packed, field, bit_count=None):
+    """
+    Décode une colonne booléenne.
+
+    Args:
+        packed: Données binaires décompressées
+        field: Nom du champ (pour les messages d'erreur)
+        bit_count: Nombre de valeurs si la colonne est packée à 1 bit par
+            valeur, None pour l'ancien format (1 byte par valeur)
+
+    Returns:
+        list: Valeurs décodées
+    """
+    if bit_count is None:
+        return np.frombuffer(packed, dtype=np.bool_).tolist()
+
+    if len(packed) != (bit_count + 7) // 8:
+        raise JONXDecodeError(
+            f"Taille invalide pour la colonne bool '{field}'",
+            {"field": field, "packed_size": len(packed), "num_rows": bit_count}
+        )
+
+    bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8), count=bit_count, bitorder="little")
+    return bits.view(np.bool_).tolist()
+
+
+def _bool_bit_count(schema):
+    """
+    Retourne le nombre de valeurs des colonnes bool packées à 1 bit, ou None
+    si le fichier utilise l'ancien format (1 byte par valeur).
+
+    Args:
+        schema: Schéma du fichier
+
+    Returns:
+        int ou None: Nombre de lignes déclaré dans le schéma
+    """
+    if schema.get("bool_format") != "bits":
+        return None
+
+    num_rows = schema.get("num_rows")
+    if not isinstance(num_rows, int) or num_rows < 0:
+        raise JONXSchemaError(
+            "Le schéma doit indiquer num_rows pour les colonnes bool packées",
+            {"num_rows": num_rows}
+        )
+    return num_rows
+
+
+def _inline_dictionary_fields(schema):
+    """
+    Retourne les colonnes enum / string_dict dont le dictionnaire est
+    embarqué dans le blob de la colonne.
+
+    Args:
+        schema: Schéma du fichier
+
+    Returns:
+        set: Noms des colonnes concernées
+    """
+    if schema.get("dictionary_format") != "inline":
+        return set()
+
+    # Une colonne avec un mapping dans le schéma garde les indices JSON
+    with_mapping = set(schema.get("enum_mappings", {})) | set(schema.get("string_dicts", {}))
+    return {
+        field for field, col_type in schema["types"].items()
+        if col_type in ("enum", "string_dict") and field not in with_mapping
+    }
+
+
+def _decode_dictionary_column(packed, field):
+    """
+    Décode une colonne encodée par dictionnaire inline.
+
+    Format: [u32 nb valeurs distinctes][u32 taille du dictionnaire]
+            [dictionnaire JSON (liste)][codes uint8/uint16/uint32]
+
+    Args:
+        packed: Données binaires décompressées
+        field: Nom du champ (pour les messages d'erreur)
+
+    Returns:
+        list: Valeurs décodées
+    """
+    if len(packed) < 8:
+        raise JONXDecodeError(
+            f"En-tête de dictionnaire manquant pour la colonne '{field}'",
+            {"field": field, "packed_size": len(packed)}
+        )
+
+    num_unique = _U32.unpack_from(packed, 0)[0]
+    dict_size = _U32.unpack_from(packed, 4)[0]
+    codes_offset = 8 + dict_size
+
+    if len(packed) < codes_offset:
+        raise JONXDecodeError(
+            f"Dictionnaire tronqué pour la colonne '{field}'",
+            {"field": field, "dict_size": dict_size, "packed_size": len(packed)}
+        )
+
+    try:
+        dictionary = orjson.loads(packed[8:codes_offset])
+        codes = np.frombuffer(packed, dtype=dictionary_code_dtype(num_unique), offset=codes_offset)
+    except (orjson.JSONDecodeError, ValueError) as e:
+        raise JONXDecodeError(
+            f"Erreur lors du décodage du dictionnaire de la colonne '{field}'",
+            {"field": field, "error": str(e)}
+        ) from e
+
+    if not isinstance(dictionary, list) or len(dictionary) != num_unique:
+        raise JONXDecodeError(
+            f"Dictionnaire invalide pour la colonne '{field}'",
+            {"field": field, "num_unique": num_unique}
+        )
+
+    if codes.size and int(codes.max()) >= num_unique:
+        raise JONXDecodeError(
+            f"Code hors dictionnaire dans la colonne '{field}'",
+            {"field": field, "num_unique": num_unique, "max_code": int(codes.max())}
+        )
+
+    # Indexation numpy sur un tableau d'objets : une seule boucle C
+    return np.asarray(dictionary, dtype=object)[codes].tolist()
+
+
+def _decode_delta_index(raw, field):
+    """
+    Décode un index de tri au format "delta".
+
+    Format: [u8 codage][positions int32 LE | deltas uint8]
+
+    Args:
+        raw: Données de l'index décompressées
+        field: Nom de la colonne indexée (pour les messages d'erreur)
+
+    Returns:
+        np.ndarray: Positions des lignes triées par valeur croissante
+
+    Raises:
+        JONXIndexError: Si le codage ou la taille de l'index est invalide
+    """
+    if len(raw) < 1:
+        raise JONXIndexError(
+            f"Octet de codage manquant pour l'index de '{field}'",
+            {"field": field, "index_size": len(raw)}
+        )
+
+    codec = raw[0]
+    dtype = INDEX_CODEC_DTYPES.get(codec)
+    if dtype is None:
+        raise JONXIndexError(
+            f"Codage d'index inconnu pour '{field}': {codec}",
+            {"field": field, "codec": codec}
+        )
+
+    if (len(raw) - 1) % dtype.itemsize != 0:
+        raise JONXIndexError(
+            f"Taille invalide pour l'index de '{field}'",
+            {"field": field, "index_size": len(raw) - 1, "expected_multiple": dtype.itemsize}
+        )
+
+    values = np.frombuffer(raw, dtype=dtype, offset=1)
+    if codec == INDEX_RAW_I32:
+        return values
+    return np.cumsum(values, dtype=np.int32)
+
 
 def _decode_temporal_column(packed, col_type, field):
     """
@@ -206,33 +395,233 @@ def _decode_nullable_column(packed, col_type, field, schema):
             ) from e
 
 
-def decode_from_bytes(data: bytes) -> dict:
+def _make_decompressor(dict_data=None):
     """
-    Décode des bytes JONX en données JSON avec validation complète.
+    Crée un décompresseur zstd, avec dictionnaire partagé si fourni.
 
-    Supporte les types:
-    - Entiers signés: int8, int16, int32, int64
-    - Entiers non-signés: uint8, uint16, uint32, uint64
-    - Flottants: float16, float32, float64
-    - Booléens: bool
-    - Chaînes: string, string_dict
-    - Temporels: date, datetime, timestamp_ms
-    - Spéciaux: enum, uuid, binary
-    - Nullable: nullable<T> pour tout type T
+    Un décompresseur muni d'un dictionnaire lit aussi les trames compressées
+    sans dictionnaire : les fichiers existants restent lisibles.
 
     Args:
-        data: Données JONX à décoder
+        dict_data: Dictionnaire zstd brut (bytes) ou None
 
     Returns:
-        dict: Dictionnaire avec version, fields, types, num_rows, json_data
+        zstd.ZstdDecompressor: Décompresseur prêt à l'emploi
 
     Raises:
-        JONXDecodeError: Si le décodage échoue
-        JONXValidationError: Si les données sont corrompues
+        JONXValidationError: Si dict_data n'est pas de type bytes
+    """
+    if dict_data is None:
+        return zstd.ZstdDecompressor()
+
+    if not isinstance(dict_data, (bytes, bytearray)):
+        raise JONXValidationError(
+            "Le dictionnaire zstd doit être de type bytes",
+            {"type": type(dict_data).__name__}
+        )
+
+    return zstd.ZstdDecompressor(dict_data=zstd.ZstdCompressionDict(bytes(dict_data)))
+
+
+def _check_dictionary(schema, dict_data):
+    """
+    Vérifie, avant toute décompression, que le dictionnaire zstd fourni
+    est celui déclaré par le schéma (clé dict_id).
+
+    Args:
+        schema: Schéma du fichier
+        dict_data: Dictionnaire zstd brut (bytes) ou None
+
+    Raises:
+        JONXDecodeError: Si le dictionnaire requis est absent ou différent
+    """
+    expected_id = schema.get("dict_id")
+    if not expected_id:
+        return
+
+    if dict_data is None:
+        raise JONXDecodeError(
+            f"Le fichier nécessite le dictionnaire zstd {expected_id}",
+            {"dict_id": expected_id}
+        )
+
+    actual_id = zstd.ZstdCompressionDict(bytes(dict_data)).dict_id()
+    if actual_id != expected_id:
+        raise JONXDecodeError(
+            f"Le dictionnaire zstd fourni ({actual_id}) ne correspond pas "
+            f"à celui du fichier ({expected_id})",
+            {"dict_id": expected_id, "provided_dict_id": actual_id}
+        )
+
+
+def _split_blob(blob, version):
+    """
+    Sépare l'octet de compression d'un blob de sa charge utile.
+
+    Args:
+        blob: Blob lu dans le fichier (vue)
+        version: Version du format JONX
+
+    Returns:
+        tuple: (compressed, payload) où compressed indique une trame zstd
+
+    Raises:
+        JONXDecodeError: Si l'octet de compression est absent ou inconnu
+    """
+    if version < BLOB_FLAG_VERSION:
+        return True, blob
+
+    if len(blob) == 0:
+        raise JONXDecodeError(
+            "Blob vide : octet de compression manquant",
+            {"version": version}
+        )
+
+    flag = blob[0]
+    if flag == BLOB_ZSTD:
+        return True, blob[1:]
+    if flag == BLOB_RAW:
+        return False, blob[1:]
+
+    raise JONXDecodeError(
+        f"Octet de compression inconnu: {flag}",
+        {"flag": flag, "supported": [BLOB_RAW, BLOB_ZSTD]}
+    )
+
+
+def _unpack_blob(dctx, blob, version):
+    """
+    Retourne le contenu d'un blob, décompressé si nécessaire.
+
+    Args:
+        dctx: Décompresseur zstd
+        blob: Blob lu dans le fichier (vue)
+        version: Version du format JONX
+
+    Returns:
+        bytes ou memoryview: Contenu du blob
+
+    Raises:
+        JONXDecodeError: Si l'octet de compression est invalide
+        zstd.ZstdError: Si la décompression échoue
+    """
+    compressed, payload = _split_blob(blob, version)
+    return dctx.decompress(payload) if compressed else payload
+
+
+def _decompress_error(field, frame, error):
+    """
+    Construit l'erreur de décompression d'une colonne.
+
+    Signale explicitement le cas d'une trame compressée avec un dictionnaire
+    zstd absent ou différent de celui fourni.
+
+    Args:
+        field: Nom de la colonne
+        frame: Trame compressée de la colonne
+        error: Exception zstd d'origine
+
+    Returns:
+        JONXDecodeError: Erreur à lever
+    """
+    try:
+        dict_id = zstd.get_frame_parameters(frame).dict_id
+    except zstd.ZstdError:
+        dict_id = 0
+
+    if dict_id:
+        return JONXDecodeError(
+            f"La colonne '{field}' nécessite le dictionnaire zstd {dict_id}",
+            {"field": field, "dict_id": dict_id, "error": str(error)}
+        )
+
+    return JONXDecodeError(
+        f"Erreur lors de la décompression de la colonne '{field}'",
+        {"field": field, "error": str(error)}
+    )
+
+
+def _decompress_frames(dctx, frames, fields, version):
+    """
+    Retourne le contenu des blobs de toutes les colonnes.
+
+    Les blobs stockés bruts (v5) sont retournés tels quels ; les trames zstd
+    sont décompressées ensemble par _decompress_zstd_frames.
+
+    Args:
+        dctx: Décompresseur zstd
+        frames: Liste des blobs des colonnes (un par colonne)
+        fields: Noms des colonnes correspondantes (pour les messages d'erreur)
+        version: Version du format JONX
+
+    Returns:
+        list: Données décompressées, dans l'ordre de frames
+    """
+    blobs = [_split_blob(frame, version) for frame in frames]
+    zstd_fields = [field for field, (is_zstd, _) in zip(fields, blobs) if is_zstd]
+    zstd_frames = [payload for is_zstd, payload in blobs if is_zstd]
+
+    decompressed = iter(_decompress_zstd_frames(dctx, zstd_frames, zstd_fields))
+    return [next(decompressed) if is_zstd else payload for is_zstd, payload in blobs]
+
+
+def _decompress_zstd_frames(dctx, frames, fields):
     """
-    if not isinstance(data, bytes):
+    Décompresse les trames zstd de toutes les colonnes en un seul appel.
+
+    Au-delà de PARALLEL_DECOMPRESS_MIN_BYTES, les trames sont réparties sur
+    tous les cœurs par zstd (hors GIL). Si la décompression groupée n'est pas
+    disponible (backend cffi) ou échoue, on repasse trame par trame afin
+    d'identifier la colonne fautive.
+
+    Args:
+        dctx: Décompresseur zstd
+        frames: Liste des trames compressées
+        fields: Noms des colonnes correspondantes (pour les messages d'erreur)
+
+    Returns:
+        list: Données décompressées, dans l'ordre de frames
+    """
+    if not frames:
+        return []
+
+    total_size = sum(len(frame) for frame in frames)
+    threads = -1 if len(frames) > 1 and total_size >= PARALLEL_DECOMPRESS_MIN_BYTES else 0
+
+    try:
+        segments = dctx.multi_decompress_to_buffer(frames, threads=threads)
+        return [memoryview(segment) for segment in segments]
+    except (zstd.ZstdError, ValueError, NotImplementedError, AttributeError):
+        pass
+
+    packed_columns = []
+    for field, frame in zip(fields, frames):
+        try:
+            packed_columns.append(dctx.decompress(frame))
+        except zstd.ZstdError as e:
+            raise _decompress_error(field, frame, e) from e
+    return packed_columns
+
+
+def _read_header_and_schema(data, dctx):
+    """
+    Lit et valide l'en-tête JONX et le schéma, sans toucher aux colonnes.
+
+    Args:
+        data: Données JONX (bytes-like)
+        dctx: Décompresseur zstd
+
+    Returns:
+        tuple: (version, schema, offset) où offset pointe sur la première colonne
+
+    Raises:
+        JONXDecodeError: Si l'en-tête ou le schéma est illisible
+        JONXSchemaError: Si le schéma est invalide
+        JONXValidationError: Si les données ne sont pas bytes-like
+    """
+    if not isinstance(data, (bytes, bytearray, memoryview)):
         raise JONXValidationError(
-            "Les données doivent être de type bytes",
+            "Les données doivent être de type bytes, bytearray ou memoryview",
             {"type": type(data).__name__}
         )
 
@@ -242,7 +631,7 @@ def decode_from_bytes(data: bytes) -> dict:
             {"data_length": len(data), "min_length": 8}
         )
 
-    if not data.startswith(b"JONX"):
+    if bytes(data[:4]) != b"JONX":
         raise JONXDecodeError(
             "Le fichier n'est pas au format JONX (signature invalide)",
             {
@@ -252,20 +641,19 @@ def decode_from_bytes(data: bytes) -> dict:
         )
 
     try:
-        version = struct.unpack("I", data[4:8])[0]
+        version = _U32.unpack_from(data, 4)[0]
     except struct.error as e:
         raise JONXDecodeError(
             "Erreur lors de la lecture de la version",
             {"error": str(e)}
         ) from e
 
-    if version not in (1, 2, 3):
+    if version not in SUPPORTED_VERSIONS:
         raise JONXDecodeError(
             f"Version JONX non supportée: {version}",
-            {"version": version, "supported": [1, 2, 3]}
+            {"version": version, "supported": list(SUPPORTED_VERSIONS)}
         )
 
-    c = zstd.ZstdDecompressor()
     offset = 8
 
     # --- Lire le schéma ---
@@ -276,7 +664,7 @@ def decode_from_bytes(data: bytes) -> dict:
         )
 
     try:
-        schema_size = struct.unpack("I", data[offset:offset + 4])[0]
+        schema_size = _U32.unpack_from(data, offset)[0]
     except struct.error as e:
         raise JONXDecodeError(
             "Erreur lors de la lecture de la taille du schéma",
@@ -292,7 +680,7 @@ def decode_from_bytes(data: bytes) -> dict:
         )
 
     try:
-        schema_bytes = c.decompress(data[offset:offset + schema_size])
+        schema_bytes = _unpack_blob(dctx, memoryview(data)[offset:offset + schema_size], version)
         schema = orjson.loads(schema_bytes)
     except zstd.ZstdError as e:
         raise JONXDecodeError(
@@ -346,9 +734,26 @@ def decode_from_bytes(data: bytes) -> dict:
                 {"field": field, "available_types": list(types.keys())}
             )
 
-    columns = {}
+    return version, schema, offset
 
-    # --- Lire les colonnes ---
+
+def _locate_columns(data, fields, offset):
+    """
+    Repère la trame compressée de chaque colonne, sans la décompresser.
+
+    Args:
+        data: Données JONX (memoryview)
+        fields: Noms des colonnes, dans l'ordre du fichier
+        offset: Position de la première colonne
+
+    Returns:
+        tuple: (frames, offset) avec frames une vue par colonne et offset
+        la position de la section des index
+
+    Raises:
+        JONXDecodeError: Si les données sont tronquées
+    """
+    frames = []
     for field in fields:
         if len(data) < offset + 4:
             raise JONXDecodeError(
@@ -357,7 +762,7 @@ def decode_from_bytes(data: bytes) -> dict:
             )
 
         try:
-            col_size = struct.unpack("I", data[offset:offset + 4])[0]
+            col_size = _U32.unpack_from(data, offset)[0]
         except struct.error as e:
             raise JONXDecodeError(
                 f"Erreur lors de la lecture de la taille de la colonne '{field}'",
@@ -372,64 +777,87 @@ def decode_from_bytes(data: bytes) -> dict:
                 {"field": field, "offset": offset, "col_size": col_size, "data_length": len(data)}
             )
 
-        try:
-            packed = c.decompress(data[offset:offset + col_size])
-        except zstd.ZstdError as e:
-            raise JONXDecodeError(
-                f"Erreur lors de la décompression de la colonne '{field}'",
-                {"field": field, "error": str(e)}
-            ) from e
-
+        frames.append(data[offset:offset + col_size])
         offset += col_size
 
-        col_type = types[field]
-        is_nullable, base_type = _parse_nullable_type(col_type)
+    return frames, offset
 
-        try:
-            # Décoder selon le type
-            if is_nullable:
-                columns[field] = _decode_nullable_column(packed, col_type, field, schema)
-            elif base_type in NUMERIC_TYPES:
-                columns[field] = _decode_numeric_column(packed, base_type, field)
-            elif base_type in ("date", "datetime", "timestamp_ms"):
-                columns[field] = _decode_temporal_column(packed, base_type, field)
-            elif base_type in ("enum", "string_dict", "uuid", "binary"):
-                columns[field] = _decode_special_column(packed, base_type, field, schema)
-            elif base_type == "bool":
-                columns[field] = [bool(b) for b in packed]
-            else:
-                # string ou type inconnu - fallback JSON
-                try:
-                    columns[field] = orjson.loads(packed)
-                except orjson.JSONDecodeError as e:
-                    raise JONXDecodeError(
-                        f"Erreur lors du parsing JSON de la colonne '{field}'",
-                        {"field": field, "type": col_type, "error": str(e)}
-                    ) from e
 
-        except JONXDecodeError:
-            raise
-        except Exception as e:
-            raise JONXDecodeError(
-                f"Erreur inattendue lors du décodage de la colonne '{field}'",
-                {"field": field, "type": col_type, "error": str(e)}
-            ) from e
+def _read_index_section_size(data, offset):
+    """
+    Lit la taille totale de la section des index (format v5).
 
-    # Vérifier que toutes les colonnes ont la même longueur
-    if fields:
-        expected_length = len(columns[fields[0]])
-        for field in fields[1:]:
-            if len(columns[field]) != expected_length:
-                raise JONXSchemaError(
-                    f"La colonne '{field}' a une longueur incohérente",
-                    {
-                        "field": field,
-                        "expected_length": expected_length,
-                        "actual_length": len(columns[field])
-                    }
-                )
+    Args:
+        data: Données JONX (memoryview)
+        offset: Position de la section des index
+
+    Returns:
+        tuple: (section_size, offset) où offset pointe après le champ de taille
+
+    Raises:
+        JONXDecodeError: Si les données sont tronquées
+    """
+    if len(data) < offset + 4:
+        raise JONXDecodeError(
+            "Données insuffisantes pour lire la taille de la section des index",
+            {"offset": offset, "data_length": len(data)}
+        )
+
+    section_size = _U32.unpack_from(data, offset)[0]
+    offset += 4
+
+    if len(data) < offset + section_size:
+        raise JONXDecodeError(
+            "Données insuffisantes pour lire la section des index",
+            {"offset": offset, "section_size": section_size, "data_length": len(data)}
+        )
+
+    return section_size, offset
+
+
+def _skip_indexes(data, offset, version):
+    """
+    Avance au-delà de la section des index sans les lire.
+
+    Args:
+        data: Données JONX (memoryview)
+        offset: Position de la section des index
+        version: Version du format JONX
+
+    Returns:
+        int: Position de fin de la section des index
+
+    Raises:
+        JONXDecodeError: Si les données sont tronquées
+    """
+    if version >= INDEX_SECTION_SIZE_VERSION:
+        section_size, offset = _read_index_section_size(data, offset)
+        return offset + section_size
+
+    # Anciennes versions : parcourir les entrées pour trouver la fin
+    return _locate_indexes(data, offset, version)[1]
+
+
+def _locate_indexes(data, offset, version):
+    """
+    Repère les index compressés, sans les décompresser.
+
+    Args:
+        data: Données JONX (memoryview)
+        offset: Position de la section des index
+        version: Version du format JONX
+
+    Returns:
+        tuple: (indexes, offset) avec indexes un dictionnaire {nom: vue}
+
+    Raises:
+        JONXDecodeError: Si les données sont tronquées
+    """
+    if version >= INDEX_SECTION_SIZE_VERSION:
+        section_size, offset = _read_index_section_size(data, offset)
+        # Borner la lecture des entrées à la section déclarée
+        data = data[:offset + section_size]
 
-    # --- Lire les index (ignorés pour la reconstruction) ---
     if len(data) < offset + 4:
         raise JONXDecodeError(
             "Données insuffisantes pour lire le nombre d'index",
@@ -437,7 +865,7 @@ def decode_from_bytes(data: bytes) -> dict:
         )
 
     try:
-        num_indexes = struct.unpack("I", data[offset:offset + 4])[0]
+        num_indexes = _U32.unpack_from(data, offset)[0]
     except struct.error as e:
         raise JONXDecodeError(
             "Erreur lors de la lecture du nombre d'index",
@@ -446,6 +874,7 @@ def decode_from_bytes(data: bytes) -> dict:
 
     offset += 4
 
+    indexes = {}
     for i in range(num_indexes):
         if len(data) < offset + 4:
             raise JONXDecodeError(
@@ -454,7 +883,7 @@ def decode_from_bytes(data: bytes) -> dict:
             )
 
         try:
-            name_len = struct.unpack("I", data[offset:offset + 4])[0]
+            name_len = _U32.unpack_from(data, offset)[0]
         except struct.error as e:
             raise JONXDecodeError(
                 f"Erreur lors de la lecture de la taille du nom d'index {i}",
@@ -469,6 +898,7 @@ def decode_from_bytes(data: bytes) -> dict:
                 {"index": i, "offset": offset, "name_len": name_len, "data_length": len(data)}
             )
 
+        name = bytes(data[offset:offset + name_len]).decode("utf-8")
         offset += name_len
 
         if len(data) < offset + 4:
@@ -478,7 +908,7 @@ def decode_from_bytes(data: bytes) -> dict:
             )
 
         try:
-            idx_size = struct.unpack("I", data[offset:offset + 4])[0]
+            idx_size = _U32.unpack_from(data, offset)[0]
         except struct.error as e:
             raise JONXDecodeError(
                 f"Erreur lors de la lecture de la taille de l'index {i}",
@@ -493,20 +923,145 @@ def decode_from_bytes(data: bytes) -> dict:
                 {"index": i, "offset": offset, "idx_size": idx_size, "data_length": len(data)}
             )
 
+        indexes[name] = data[offset:offset + idx_size]
         offset += idx_size
 
-    # --- Reconstruire JSON ---
+    return indexes, offset
+
+
+def decode_columns_from_bytes(data: bytes, dict_data: bytes = None) -> dict:
+    """
+    Décode des bytes JONX en colonnes, sans reconstruire les lignes JSON.
+
+    Plus rapide et plus économe en mémoire que decode_from_bytes lorsque
+    l'appelant travaille colonne par colonne : aucune liste de dictionnaires
+    n'est allouée, et les colonnes numériques restent des tableaux numpy.
+
+    Args:
+        data: Données JONX à décoder
+        dict_data: Dictionnaire zstd utilisé à l'encodage (optionnel)
+
+    Returns:
+        dict: Dictionnaire avec version, fields, types, num_rows, columns, schema
+
+    Raises:
+        JONXDecodeError: Si le décodage échoue
+        JONXValidationError: Si les données sont corrompues
+    """
+    c = _make_decompressor(dict_data)
+    version, schema, offset = _read_header_and_schema(data, c)
+    _check_dictionary(schema, dict_data)
+    fields = schema["fields"]
+    types = schema["types"]
+
+    # Vue sans copie : les tranches passées à zstd ne dupliquent pas les données
+    mv = memoryview(data)
+    frames, offset = _locate_columns(mv, fields, offset)
+
+    # --- Lire les colonnes ---
+    bool_bits = _bool_bit_count(schema)
+    inline_dicts = _inline_dictionary_fields(schema)
+    columns = {}
+    for field, packed in zip(fields, _decompress_frames(c, frames, fields, version)):
+        col_type = types[field]
+        is_nullable, base_type = _parse_nullable_type(col_type)
+
+        try:
+            # Décoder selon le type
+            if is_nullable:
+                columns[field] = _decode_nullable_column(packed, col_type, field, schema)
+            elif base_type in NUMERIC_TYPES:
+                columns[field] = _decode_numeric_column(packed, base_type, field)
+            elif base_type in ("date", "datetime", "timestamp_ms"):
+                columns[field] = _decode_temporal_column(packed, base_type, field)
+            elif field in inline_dicts:
+                columns[field] = _decode_dictionary_column(packed, field)
+            elif base_type in ("enum", "string_dict", "uuid", "binary"):
+                columns[field] = _decode_special_column(packed, base_type, field, schema)
+            elif base_type == "bool":
+                columns[field] = _decode_bool_column(packed, field, bool_bits)
+            else:
+                # string ou type inconnu - fallback JSON
+                try:
+                    columns[field] = orjson.loads(packed)
+                except orjson.JSONDecodeError as e:
+                    raise JONXDecodeError(
+                        f"Erreur lors du parsing JSON de la colonne '{field}'",
+                        {"field": field, "type": col_type, "error": str(e)}
+                    ) from e
+
+        except JONXDecodeError:
+            raise
+        except Exception as e:
+            raise JONXDecodeError(
+                f"Erreur inattendue lors du décodage de la colonne '{field}'",
+                {"field": field, "type": col_type, "error": str(e)}
+            ) from e
+
+    # Vérifier que toutes les colonnes ont la même longueur
+    if fields:
+        expected_length = len(columns[fields[0]])
+        for field in fields[1:]:
+            if len(columns[field]) != expected_length:
+                raise JONXSchemaError(
+                    f"La colonne '{field}' a une longueur incohérente",
+                    {
+                        "field": field,
+                        "expected_length": expected_length,
+                        "actual_length": len(columns[field])
+                    }
+                )
+
+    # --- Sauter les index (ignorés pour la reconstruction) ---
+    _skip_indexes(mv, offset, version)
+
     num_rows = len(columns[fields[0]]) if fields else 0
-    json_data = [
-        {field: columns[field][i] for field in fields}
-        for i in range(num_rows)
-    ]
 
     return {
         "version": version,
         "fields": fields,
         "types": types,
         "num_rows": num_rows,
-        "json_data": json_data,
+        "columns": columns,
         "schema": schema  # Inclure le schéma complet pour debug
-    }
\ No newline at end of file
+    }
+
+
+def decode_from_bytes(data: bytes, dict_data: bytes = None) -> dict:
+    """
+    Décode des bytes JONX en données JSON avec validation complète.
+
+    Supporte les types:
+    - Entiers signés: int8, int16, int32, int64
+    - Entiers non-signés: uint8, uint16, uint32, uint64
+    - Flottants: float16, float32, float64
+    - Booléens: bool
+    - Chaînes: string, string_dict
+    - Temporels: date, datetime, timestamp_ms
+    - Spéciaux: enum, uuid, binary
+    - Nullable: nullable<T> pour tout type T
+
+    Args:
+        data: Données JONX à décoder
+        dict_data: Dictionnaire zstd utilisé à l'encodage (optionnel)
+
+    Returns:
+        dict: Dictionnaire avec version, fields, types, num_rows, json_data
+
+    Raises:
+        JONXDecodeError: Si le décodage échoue
+        JONXValidationError: Si les données sont corrompues
+    """
+    result = decode_columns_from_bytes(data, dict_data)
+    columns = result.pop("columns")
+
+    # --- Reconstruire JSON ---
+    # Transposition colonnes -> lignes en un seul passage
+    fields_tuple = tuple(result["fields"])
+    col_lists = [
+        col.tolist() if isinstance(col, np.ndarray) else col
+        for col in (columns[field] for field in fields_tuple)
+    ]
+    result["json_data"] = [dict(zip(fields_tuple, row)) for row in zip(*col_lists)]
+
+    return result
@@ -1,17 +1,61 @@
 import orjson
 import zstandard as zstd
 import struct
-import io
-from datetime import datetime
+import threading
+import numpy as np
+from collections import OrderedDict
+from datetime import datetime, date
+from uuid import UUID
 from ..exceptions import (
     JONXValidationError,
     JONXEncodeError,
     JONXSchemaError
 )
-from .packing import pack_column
+from .packing import (
+    pack_column,
+    detect_and_pack,
+    JSON_DUMPS_OPTIONS,
+    NUMERIC_PACK_DTYPES,
+)
 from .type_detection import detect_type
 
-ZSTD = zstd.ZstdCompressor(level=7)
+# threads=-1 : zstd répartit les gros blobs sur tous les cœurs disponibles
+# (sans effet sur les petites colonnes, compressées en un seul bloc)
+ZSTD = zstd.ZstdCompressor(level=7, threads=-1)
+
+# Préfixes de longueur : uint32 little-endian (format précompilé)
+_U32 = struct.Struct("<I")
+
+# Version 5 : chaque blob (schéma, colonne, index) commence par un octet
+# de compression ; la section des index est précédée de sa taille totale
+JONX_VERSION = 5
+
+# Taille par défaut des dictionnaires zstd entraînés par train_jonx_dict
+DEFAULT_DICT_SIZE = 16384
+
+# En dessous de cette taille, un blob est stocké brut sans tenter zstd :
+# l'en-tête de trame coûterait plus qu'il ne ferait gagner
+MIN_ZSTD_BYTES = 64
+BLOB_RAW = b"\x00"
+BLOB_ZSTD = b"\x01"
+
+# Volume de colonnes à partir duquel elles sont compressées en parallèle
+# (en dessous, le coût des threads domine)
+PARALLEL_COMPRESS_MIN_BYTES = 10 * 1024 * 1024
+
+# Index de tri stockés en deltas (déclaré dans le schéma) : un octet de
+# codage, puis les écarts entre positions successives en uint8 si la
+# colonne est déjà triée, sinon les positions en int32 LE
+INDEX_FORMAT = "delta"
+INDEX_RAW_I32 = 0
+INDEX_DELTA_U8 = 1
+
+# Colonnes bool packées à 1 bit par valeur (déclaré dans le schéma)
+BOOL_FORMAT = "bits"
+
+# Colonnes enum / string_dict : dictionnaire embarqué dans le blob de la
+# colonne, codes en entiers non signés (déclaré dans le schéma)
+DICTIONARY_FORMAT = "inline"
 
 # Types supportés
 NUMERIC_TYPES = {
@@ -22,6 +66,16 @@ NUMERIC_TYPES = {
 
 TEMPORAL_TYPES = {"date", "datetime", "timestamp_ms"}
 INDEXABLE_TYPES = NUMERIC_TYPES | TEMPORAL_TYPES
+# Types acceptés par compile_encoder : ceux dont les valeurs peuvent être
+# vérifiées à l'encodage et relues par le décodeur
+COMPILABLE_TYPES = INDEXABLE_TYPES | {
+    "bool", "string", "json", "uuid", "enum", "string_dict"
+}
+
+# Encodeurs spécialisés générés par compile_encoder, indexés par schéma
+COMPILED_ENCODER_CACHE_SIZE = 32
+_compiled_encoders = OrderedDict()
+_compiled_encoders_lock = threading.Lock()
 
 
 # -----------------------------------------------------
@@ -99,7 +153,196 @@ def _parse_nullable_type(type_str):
     return False, type_str
 
 
-def encode_to_bytes(json_data):
+def _make_compressor(dict_data=None):
+    """
+    Crée le compresseur des colonnes, avec dictionnaire partagé si fourni.
+
+    Args:
+        dict_data: Dictionnaire zstd brut (bytes) ou None
+
+    Returns:
+        tuple: (compresseur zstd, identifiant du dictionnaire ou 0)
+
+    Raises:
+        JONXValidationError: Si dict_data n'est pas de type bytes
+    """
+    if dict_data is None:
+        return ZSTD, 0
+
+    if not isinstance(dict_data, (bytes, bytearray)):
+        raise JONXValidationError(
+            "Le dictionnaire zstd doit être de type bytes",
+            {"type": type(dict_data).__name__}
+        )
+
+    zdict = zstd.ZstdCompressionDict(bytes(dict_data))
+    return zstd.ZstdCompressor(level=7, threads=-1, dict_data=zdict), zdict.dict_id()
+
+
+def train_jonx_dict(samples, dict_size=DEFAULT_DICT_SIZE):
+    """
+    Entraîne un dictionnaire zstd sur des échantillons de colonnes.
+
+    Le dictionnaire améliore nettement la compression des petites colonnes
+    aux motifs répétitifs. Il doit être fourni à l'identique à
+    encode_to_bytes puis au décodage (decode_from_bytes, JONXFile).
+
+    Args:
+        samples: Liste d'échantillons (bytes), par exemple des colonnes
+            sérialisées avec orjson.dumps
+        dict_size: Taille maximale du dictionnaire en octets
+
+    Returns:
+        bytes: Dictionnaire zstd brut
+
+    Raises:
+        JONXValidationError: Si les échantillons sont invalides
+        JONXEncodeError: Si l'entraînement échoue
+    """
+    if not isinstance(samples, list) or not samples:
+        raise JONXValidationError(
+            "Les échantillons doivent être une liste non vide",
+            {"type": type(samples).__name__}
+        )
+
+    if not all(isinstance(sample, (bytes, bytearray)) for sample in samples):
+        raise JONXValidationError(
+            "Chaque échantillon doit être de type bytes",
+            {"num_samples": len(samples)}
+        )
+
+    try:
+        return zstd.train_dictionary(dict_size, [bytes(sample) for sample in samples]).as_bytes()
+    except zstd.ZstdError as e:
+        raise JONXEncodeError(
+            "Erreur lors de l'entraînement du dictionnaire zstd",
+            {"num_samples": len(samples), "dict_size": dict_size, "error": str(e)}
+        ) from e
+
+
+def _maybe_compress(blob, cctx=ZSTD):
+    """
+    Compresse un blob en zstd, sauf s'il est trop petit pour en profiter
+    ou si la compression ne réduit pas sa taille.
+
+    Args:
+        blob: Données à stocker
+        cctx: Compresseur zstd à utiliser
+
+    Returns:
+        bytes: Octet de compression suivi des données (brutes ou zstd)
+    """
+    if len(blob) >= MIN_ZSTD_BYTES:
+        frame = cctx.compress(blob)
+        if len(frame) < len(blob):
+            return BLOB_ZSTD + frame
+    return BLOB_RAW + bytes(blob)
+
+
+def _compress_blobs(blobs, cctx=ZSTD):
+    """
+    Compresse une liste de blobs comme _maybe_compress, en parallèle quand
+    le volume le justifie.
+
+    Au-delà de PARALLEL_COMPRESS_MIN_BYTES, les blobs sont compressés
+    ensemble par zstd sur tous les cœurs (hors GIL), comme la décompression
+    groupée du décodeur. Si la compression groupée n'est pas disponible
+    (backend cffi), on repasse blob par blob.
+
+    Args:
+        blobs: Liste des données à stocker
+        cctx: Compresseur zstd à utiliser
+
+    Returns:
+        list: Blobs avec octet de compression, dans l'ordre de blobs
+    """
+    targets = [i for i, blob in enumerate(blobs) if len(blob) >= MIN_ZSTD_BYTES]
+    total_size = sum(len(blobs[i]) for i in targets)
+
+    if len(targets) > 1 and total_size >= PARALLEL_COMPRESS_MIN_BYTES:
+        try:
+            frames = cctx.multi_compress_to_buffer([blobs[i] for i in targets], threads=-1)
+        except (NotImplementedError, AttributeError):
+            frames = None
+
+        if frames is not None:
+            frames = dict(zip(targets, frames))
+            results = []
+            for i, blob in enumerate(blobs):
+                frame = frames.get(i)
+                if frame is not None and len(frame) < len(blob):
+                    results.append(BLOB_ZSTD + bytes(frame))
+                else:
+                    results.append(BLOB_RAW + bytes(blob))
+            return results
+
+    return [_maybe_compress(blob, cctx) for blob in blobs]
+
+
+def _put_blob(buf, offset, blob):
+    """
+    Écrit un blob précédé de sa taille (uint32) dans un buffer préalloué.
+
+    Args:
+        buf: Buffer de sortie (bytearray)
+        offset: Position d'écriture
+        blob: Données à écrire
+
+    Returns:
+        int: Position suivant le blob
+    """
+    size = len(blob)
+    _U32.pack_into(buf, offset, size)
+    offset += 4
+    buf[offset:offset + size] = blob
+    return offset + size
+
+
+def _sort_index(values, is_nullable):
+    """
+    Calcule l'index de tri (stable) d'une colonne, les None en premier.
+
+    Args:
+        values: Valeurs de la colonne
+        is_nullable: La colonne peut contenir des None
+
+    Returns:
+        np.ndarray: Positions des lignes dans l'ordre croissant des valeurs
+    """
+    if not is_nullable:
+        return np.argsort(np.asarray(values), kind="stable")
+
+    present = np.fromiter((v is not None for v in values), dtype=np.bool_, count=len(values))
+    nulls = np.flatnonzero(~present)
+    rows = np.flatnonzero(present)
+    clean = np.asarray([v for v in values if v is not None])
+    return np.concatenate((nulls, rows[np.argsort(clean, kind="stable")]))
+
+
+def _pack_index(sorted_idx):
+    """
+    Sérialise un index de tri, en deltas quand c'est possible.
+
+    Une colonne déjà triée donne l'index [0, 1, 2, ...] : ses deltas
+    tiennent sur un octet et se compressent presque entièrement.
+
+    Args:
+        sorted_idx: Positions des lignes triées (np.ndarray d'entiers)
+
+    Returns:
+        bytes: Octet de codage suivi des données de l'index
+    """
+    if sorted_idx.size:
+        # Une permutation n'a que des écarts positifs que si c'est l'identité :
+        # les deltas valent alors 0 puis 1 et tiennent sur un octet
+        deltas = np.diff(sorted_idx, prepend=0)
+        if deltas.min() >= 0:
+            return bytes((INDEX_DELTA_U8,)) + deltas.astype("<u1").tobytes()
+
+    return bytes((INDEX_RAW_I32,)) + sorted_idx.astype("<i4").tobytes()
+
+
+def encode_to_bytes(json_data, dict_data=None):
     """
     Encode des données JSON en bytes JONX avec validation complète.
 
@@ -115,6 +358,8 @@ def encode_to_bytes(json_data):
 
     Args:
         json_data: Liste d'objets JSON à encoder
+        dict_data: Dictionnaire zstd partagé pour les colonnes (optionnel,
+            voir train_jonx_dict). Le schéma et les index n'en dépendent pas.
 
     Returns:
         bytes: Données JONX encodées
@@ -128,10 +373,316 @@ def encode_to_bytes(json_data):
         _validate_json_data(json_data)
 
         fields = list(json_data[0].keys())
-        columns = {f: [row[f] for row in json_data] for f in fields}
+
+        # Extraction des colonnes en un seul passage sur les lignes
+        columns = {f: [] for f in fields}
+        appenders = [(f, columns[f].append) for f in fields]
+        for row in json_data:
+            for f, append in appenders:
+                append(row[f])
+
+    except (JONXValidationError, JONXSchemaError):
+        raise
+    except Exception as e:
+        raise JONXEncodeError(
+            "Erreur inattendue lors de l'encodage",
+            {"error": str(e), "error_type": type(e).__name__}
+        ) from e
+
+    return encode_columns_to_bytes(fields, columns, dict_data)
+
+
+def _coerce_numeric(values, col_type, field):
+    """
+    Convertit une colonne extraite par un encodeur compilé vers le dtype
+    numpy de son type déclaré, en refusant les conversions avec perte.
+
+    Args:
+        values: Liste des valeurs de la colonne
+        col_type: Type déclaré (bool ou type numérique)
+        field: Nom de la colonne (pour les messages d'erreur)
+
+    Returns:
+        np.ndarray: Valeurs au dtype du type déclaré
+
+    Raises:
+        JONXEncodeError: Si les valeurs ne correspondent pas au type déclaré
+    """
+    dtype = np.dtype(np.bool_ if col_type == "bool" else NUMERIC_PACK_DTYPES[col_type])
+    try:
+        arr = np.asarray(values)
+    except (ValueError, TypeError) as e:
+        # Valeurs imbriquées de longueurs différentes, ...
+        raise JONXEncodeError(
+            f"La colonne '{field}' ne correspond pas au type {col_type}",
+            {"field": field, "type": col_type, "error": str(e)}
+        ) from e
+    # Listes imbriquées de même longueur : numpy construit un tableau 2D
+    kind = arr.dtype.kind if arr.ndim == 1 else "O"
+
+    if dtype.kind == "b":
+        valid = kind == "b"
+    elif dtype.kind in "iu":
+        valid = kind in "iu"
+        if not valid and all(type(v) is int for v in values):
+            # Entiers au-delà de int64 : numpy les infère en float64 ou objet
+            try:
+                return np.array(values, dtype=dtype)
+            except OverflowError:
+                pass
+        elif valid and arr.size:
+            info = np.iinfo(dtype)
+            valid = info.min <= arr.min() and arr.max() <= info.max
+    else:
+        valid = kind in "iuf"
+
+    # numpy convertit True en 1 dans un tableau d'entiers ou de flottants
+    if valid and dtype.kind != "b" and bool in set(map(type, values)):
+        valid = False
+
+    if not valid:
+        raise JONXEncodeError(
+            f"La colonne '{field}' ne correspond pas au type {col_type}",
+            {"field": field, "type": col_type, "inferred_dtype": str(arr.dtype)}
+        )
+
+    with np.errstate(over="ignore"):
+        result = arr.astype(dtype, copy=False)
+
+    # Flottants hors plage : le cast les transforme en inf sans erreur
+    if dtype.kind == "f" and result is not arr:
+        if np.count_nonzero(np.isfinite(result)) != np.count_nonzero(np.isfinite(arr)):
+            raise JONXEncodeError(
+                f"La colonne '{field}' contient des valeurs hors de la plage {col_type}",
+                {"field": field, "type": col_type}
+            )
+
+    return result
+
+
+def _parses_isoformat(value):
+    try:
+        datetime.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _parses_uuid(value):
+    try:
+        UUID(value)
+        return True
+    except ValueError:
+        return False
+
+
+# Validation des valeurs des colonnes non numériques d'un encodeur compilé,
+# alignée sur ce que le décodeur sait relire
+VALUE_CHECKS = {
+    "string": lambda v: type(v) is str,
+    "enum": lambda v: type(v) is str,
+    "string_dict": lambda v: type(v) is str,
+    "date": lambda v: isinstance(v, date) or (type(v) is str and _parses_isoformat(v)),
+    "datetime": lambda v: isinstance(v, datetime) or (type(v) is str and _parses_isoformat(v)),
+    "timestamp_ms": lambda v: isinstance(v, datetime) or type(v) in (int, float),
+    "uuid": lambda v: isinstance(v, UUID) or (type(v) is str and _parses_uuid(v)),
+}
+
+
+def _check_values(values, col_type, field):
+    """
+    Vérifie qu'une colonne extraite par un encodeur compilé correspond à
+    son type déclaré (types non numériques).
+
+    Args:
+        values: Liste des valeurs de la colonne
+        col_type: Type déclaré
+        field: Nom de la colonne (pour les messages d'erreur)
+
+    Returns:
+        list: values, inchangée
+
+    Raises:
+        JONXEncodeError: Si une valeur ne correspond pas au type déclaré
+    """
+    check = VALUE_CHECKS[col_type]
+
+    # Les index temporels trient les valeurs telles quelles : chaînes ISO
+    # et objets date / datetime ne peuvent pas être mélangés
+    if col_type in TEMPORAL_TYPES:
+        kinds = set(map(type, values))
+        if len(kinds) > 1 and not kinds <= {int, float}:
+            raise JONXEncodeError(
+                f"La colonne '{field}' mélange plusieurs représentations du type {col_type}",
+                {"field": field, "type": col_type, "value_types": sorted(k.__name__ for k in kinds)}
+            )
+
+    try:
+        # Chaque valeur distincte n'est vérifiée qu'une fois
+        candidates = set(values)
+    except TypeError:
+        candidates = values
+
+    for value in candidates:
+        if not check(value):
+            raise JONXEncodeError(
+                f"La colonne '{field}' ne correspond pas au type {col_type}",
+                {"field": field, "type": col_type, "value": repr(value)[:100]}
+            )
+    return values
+
+
+def _generate_extractor(fields, types):
+    """
+    Génère le code d'extraction des colonnes pour un schéma donné : une
+    boucle sur les lignes, sans dispatch par type ni boucle sur les champs.
+
+    Args:
+        fields: Noms des colonnes
+        types: Types des colonnes {nom: type}
+
+    Returns:
+        function: extract(rows) -> dict {nom: colonne}, ou None si une
+            ligne n'a pas le bon nombre de clés
+    """
+    lines = ["def extract(rows):"]
+    for i in range(len(fields)):
+        lines.append(f"    c{i} = []")
+        lines.append(f"    a{i} = c{i}.append")
+    lines.append("    for row in rows:")
+    lines.append(f"        if len(row) != {len(fields)}:")
+    lines.append("            return None")
+    for i, f in enumerate(fields):
+        lines.append(f"        a{i}(row[{f!r}])")
+
+    lines.append("    return {")
+    for i, f in enumerate(fields):
+        if types[f] == "bool" or types[f] in NUMERIC_TYPES:
+            # Colonnes numériques et bool : tableaux numpy typés
+            lines.append(f"        {f!r}: _coerce_numeric(c{i}, {types[f]!r}, {f!r}),")
+        elif types[f] in VALUE_CHECKS:
+            lines.append(f"        {f!r}: _check_values(c{i}, {types[f]!r}, {f!r}),")
+        else:
+            # json : toute valeur sérialisable par orjson
+            lines.append(f"        {f!r}: c{i},")
+    lines.append("    }")
+
+    namespace = {"_coerce_numeric": _coerce_numeric, "_check_values": _check_values}
+    exec("\n".join(lines), namespace)
+    return namespace["extract"]
+
+
+def compile_encoder(schema):
+    """
+    Génère un encodeur spécialisé pour un schéma fixe.
+
+    Pour des données qui ont toujours le même schéma, l'encodeur généré
+    extrait les colonnes en une boucle écrite pour ces champs et saute la
+    détection des types. Chaque valeur est vérifiée contre son type
+    déclaré. Les encodeurs sont mis en cache par schéma.
+
+    Args:
+        schema: Dictionnaire ordonné {nom_colonne: type}, avec les types
+            de detect_type hors nullable<T> et binary (ex: {"id": "uint32",
+            "price": "float32", "city": "enum"})
+
+    Returns:
+        function: encode(json_data, dict_data=None) -> bytes, qui lève
+            JONXEncodeError si une valeur ne correspond pas à son type
+
+    Raises:
+        JONXSchemaError: Si le schéma est vide ou contient un type non pris
+            en charge
+
+    Examples:
+        >>> encode = compile_encoder({"id": "uint16", "price": "float32"})
+        >>> jonx_bytes = encode([{"id": 1, "price": 9.5}])
+    """
+    if not isinstance(schema, dict) or not schema:
+        raise JONXSchemaError(
+            "Le schéma doit être un dictionnaire non vide {colonne: type}",
+            {"type": type(schema).__name__}
+        )
+
+    for field, col_type in schema.items():
+        if not (isinstance(field, str) and isinstance(col_type, str)
+                and col_type in COMPILABLE_TYPES):
+            raise JONXSchemaError(
+                f"Type non pris en charge pour la colonne '{field}': {col_type}",
+                {"field": field, "type": col_type}
+            )
+
+    key = tuple(schema.items())
+    with _compiled_encoders_lock:
+        encoder = _compiled_encoders.get(key)
+        if encoder is not None:
+            _compiled_encoders.move_to_end(key)
+            return encoder
+
+    fields = list(schema)
+    types = dict(schema)
+    extract = _generate_extractor(fields, types)
+
+    def encode(json_data, dict_data=None):
+        columns = None
+        if isinstance(json_data, list) and json_data:
+            try:
+                columns = extract(json_data)
+            except (KeyError, TypeError):
+                columns = None
+
+        if columns is None:
+            # Diagnostic précis sur le chemin lent, seulement en cas d'échec
+            _validate_json_data(json_data)
+            actual_keys = set(json_data[0].keys())
+            raise JONXSchemaError(
+                "Les objets JSON ne correspondent pas au schéma compilé",
+                {
+                    "expected_keys": sorted(fields),
+                    "actual_keys": sorted(actual_keys),
+                    "missing_keys": sorted(set(fields) - actual_keys) or None,
+                    "extra_keys": sorted(actual_keys - set(fields)) or None
+                }
+            )
+
+        return encode_columns_to_bytes(fields, columns, dict_data, types=types)
+
+    with _compiled_encoders_lock:
+        _compiled_encoders[key] = encode
+        _compiled_encoders.move_to_end(key)
+        if len(_compiled_encoders) > COMPILED_ENCODER_CACHE_SIZE:
+            _compiled_encoders.popitem(last=False)
+    return encode
+
+
+def encode_columns_to_bytes(fields, columns, dict_data=None, types=None):
+    """
+    Encode des colonnes déjà extraites en bytes JONX.
+
+    Point d'entrée commun à encode_to_bytes, au lecteur JSON en flux de
+    jonx_encode et aux encodeurs générés par compile_encoder.
+
+    Args:
+        fields: Noms des colonnes, dans l'ordre du fichier
+        columns: Dictionnaire {nom_colonne: liste ou tableau de valeurs}
+        dict_data: Dictionnaire zstd partagé pour les colonnes (optionnel)
+        types: Types des colonnes {nom: type} (optionnel). S'ils sont
+            fournis, la détection est sautée et les enum / string_dict
+            utilisent un dictionnaire inline.
+
+    Returns:
+        bytes: Données JONX encodées
+
+    Raises:
+        JONXValidationError: Si les données sont invalides
+        JONXSchemaError: Si les colonnes ont des longueurs différentes
+        JONXEncodeError: Si l'encodage échoue
+    """
+    try:
+        cctx, dict_id = _make_compressor(dict_data)
 
         # Vérifier que toutes les colonnes ont la même longueur
-        expected_length = len(json_data)
+        expected_length = len(columns[fields[0]])
         for field, values in columns.items():
             if len(values) != expected_length:
                 raise JONXSchemaError(
@@ -143,10 +694,12 @@ def encode_to_bytes(json_data):
                     }
                 )
 
-        # Détection complète des types
-        types = {}
+        # Détection complète des types (sauf si le schéma est imposé)
+        types_given = types is not None
+        types = dict(types) if types_given else {}
         enum_mappings = {}  # Pour stocker les mappings enum
         string_dicts = {}  # Pour stocker les dictionnaires string_dict
+        packed = {}  # Colonnes déjà packées lors de la détection
 
         for f, col in columns.items():
             if len(col) == 0:
@@ -154,7 +707,15 @@ def encode_to_bytes(json_data):
                     f"La colonne '{f}' est vide",
                     {"field": f}
                 )
+            if types_given:
+                continue
             try:
+                # Colonnes homogènes int/float/bool : détection et packing fusionnés
+                fused = detect_and_pack(col)
+                if fused is not None:
+                    types[f], packed[f] = fused
+                    continue
+
                 detected = detect_type(col)
 
                 # Gérer les types complexes retournés comme dict
@@ -185,9 +746,10 @@ def encode_to_bytes(json_data):
                     {"field": f, "error": str(e)}
                 ) from e
 
-        # Compression colonnes
-        compressed_columns = {}
+        # Packing des colonnes restantes
         for f in fields:
+            if f in packed:
+                continue
             try:
                 # Préparer les métadonnées pour pack_column
                 pack_kwargs = {}
@@ -199,14 +761,23 @@ def encode_to_bytes(json_data):
                 elif base_type == "string_dict" or (is_nullable and base_type == "string_dict"):
                     pack_kwargs["string_dict"] = string_dicts.get(f, {})
 
-                blob = pack_column(columns[f], types[f], **pack_kwargs)
-                compressed_columns[f] = ZSTD.compress(blob)
+                packed[f] = pack_column(columns[f], types[f], **pack_kwargs)
             except Exception as e:
                 raise JONXEncodeError(
                     f"Erreur lors de l'encodage de la colonne '{f}'",
                     {"field": f, "type": types[f], "error": str(e)}
                 ) from e
 
+        # Compression colonnes
+        try:
+            blobs = _compress_blobs([packed.pop(f) for f in fields], cctx)
+        except zstd.ZstdError as e:
+            raise JONXEncodeError(
+                "Erreur lors de la compression des colonnes",
+                {"error": str(e)}
+            ) from e
+        compressed_columns = dict(zip(fields, blobs))
+
         # Index auto (types numériques et temporels)
         indexes = {}
 
@@ -216,64 +787,75 @@ def encode_to_bytes(json_data):
 
             if base_type in INDEXABLE_TYPES:
                 try:
-                    # Fonction de tri qui gère les None
-                    def sort_key(i):
-                        val = columns[f][i]
-                        if val is None:
-                            return float('-inf')
-                        return val
-
-                    sorted_idx = sorted(range(len(columns[f])), key=sort_key)
-                    indexes[f] = ZSTD.compress(orjson.dumps(sorted_idx))
+                    sorted_idx = _sort_index(columns[f], is_nullable)
+                    indexes[f] = _maybe_compress(_pack_index(sorted_idx))
                 except Exception as e:
                     raise JONXEncodeError(
                         f"Erreur lors de la création de l'index pour '{f}'",
                         {"field": f, "error": str(e)}
                     ) from e
 
-        out = io.BytesIO()
-
-        # Header
-        out.write(b"JONX")
-        out.write(struct.pack("I", 3))  # Version 3 pour tous les nouveaux types
-
         # Schema avec toutes les métadonnées
         schema = {
             "fields": fields,
             "types": types,
+            "index_format": INDEX_FORMAT,
+            "bool_format": BOOL_FORMAT,
+            "dictionary_format": DICTIONARY_FORMAT,
+            "num_rows": expected_length,
         }
 
         # Ajouter les métadonnées optionnelles seulement si présentes
+        if dict_id:
+            # Lisible avant les colonnes, pour retrouver le bon dictionnaire
+            schema["dict_id"] = dict_id
         if enum_mappings:
             schema["enum_mappings"] = enum_mappings
         if string_dicts:
             schema["string_dicts"] = string_dicts
 
         try:
-            schema_bytes = ZSTD.compress(orjson.dumps(schema))
-            out.write(struct.pack("I", len(schema_bytes)))
-            out.write(schema_bytes)
+            schema_bytes = _maybe_compress(
+                orjson.dumps(schema, option=JSON_DUMPS_OPTIONS)
+            )
         except Exception as e:
             raise JONXEncodeError(
                 "Erreur lors de l'encodage du schéma",
                 {"error": str(e)}
             ) from e
 
+        # Taille totale connue d'avance : un seul buffer, sans copies intermédiaires
+        index_entries = [(f.encode("utf-8"), idx) for f, idx in indexes.items()]
+        index_section_size = 4 + sum(8 + len(name) + len(idx) for name, idx in index_entries)
+        total_size = (
+            8  # Header
+            + 4 + len(schema_bytes)
+            + sum(4 + len(compressed_columns[f]) for f in fields)
+            + 4 + index_section_size
+        )
+        buf = bytearray(total_size)
+
+        # Header
+        buf[0:4] = b"JONX"
+        _U32.pack_into(buf, 4, JONX_VERSION)
+        offset = 8
+
+        offset = _put_blob(buf, offset, schema_bytes)
+
         # Colonnes
         for f in fields:
-            col = compressed_columns[f]
-            out.write(struct.pack("I", len(col)))
-            out.write(col)
-
-        # Index
-        out.write(struct.pack("I", len(indexes)))
-        for f, idx in indexes.items():
-            out.write(struct.pack("I", len(f)))
-            out.write(f.encode("utf-8"))
-            out.write(struct.pack("I", len(idx)))
-            out.write(idx)
-
-        return out.getvalue()
+            offset = _put_blob(buf, offset, compressed_columns[f])
+
+        # Index : taille totale de la section, puis nombre d'index et entrées,
+        # pour que le décodeur puisse sauter la section d'un seul saut
+        _U32.pack_into(buf, offset, index_section_size)
+        _U32.pack_into(buf, offset + 4, len(index_entries))
+        offset += 8
+        for name, idx in index_entries:
+            offset = _put_blob(buf, offset, name)
+            offset = _put_blob(buf, offset, idx)
+
+        return bytes(buf)
 
     except (JONXValidationError, JONXSchemaError, JONXEncodeError):
         # Re-raise les exceptions personnalisées
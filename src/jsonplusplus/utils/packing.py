@@ -3,21 +3,31 @@ import struct
 import numpy as np
 from datetime import datetime, date
 from uuid import UUID
-
-# Types numériques et leurs formats struct
-NUMERIC_PACK_FORMATS = {
-    "int8": "b",  # signed char
-    "int16": "h",  # signed short
-    "int32": "i",  # signed int
-    "int64": "q",  # signed long long
-    "uint8": "B",  # unsigned char
-    "uint16": "H",  # unsigned short
-    "uint32": "I",  # unsigned int
-    "uint64": "Q",  # unsigned long long
-    "float32": "f",  # float
-    "float64": "d",  # double
+from .type_detection import detect_numeric_type_int, detect_numeric_type_float
+
+# Types numériques et leurs dtypes numpy
+NUMERIC_PACK_DTYPES = {
+    "int8": np.int8,  # signed char
+    "int16": np.int16,  # signed short
+    "int32": np.int32,  # signed int
+    "int64": np.int64,  # signed long long
+    "uint8": np.uint8,  # unsigned char
+    "uint16": np.uint16,  # unsigned short
+    "uint32": np.uint32,  # unsigned int
+    "uint64": np.uint64,  # unsigned long long
+    "float16": np.float16,  # half float
+    "float32": np.float32,  # float
+    "float64": np.float64,  # double
 }
 
+# Préfixes de longueur : uint32 little-endian
+_U32 = struct.Struct("<I")
+
+# Options orjson des blobs JSON : les ndarrays sont sérialisés directement,
+# sans aller-retour par tolist(). Les clés non-str restent refusées : les
+# convertir en chaînes ferait perdre les clés en collision
+JSON_DUMPS_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
 
 def _parse_nullable_type(type_str):
     """
@@ -40,24 +50,40 @@ def _pack_numeric(values, col_type):
     Pack une colonne numérique.
 
     Args:
-        values: Liste de valeurs numériques
+        values: Liste ou tableau numpy de valeurs numériques
         col_type: Type numérique (int8, int16, ..., float64)
 
     Returns:
         bytes: Données packées
     """
     if col_type == "float16":
-        # float16 nécessite numpy
-        arr = np.array(values, dtype=np.float16)
-        return arr.tobytes()
+        # Parsing en float64 puis cast groupé : numpy convertit le tableau
+        # d'un bloc (instructions F16C / FP16 selon le CPU) au lieu de
+        # convertir chaque flottant Python en demi-précision un par un.
+        # Pas de passage par float32, qui arrondirait deux fois.
+        return np.asarray(values, dtype=np.float64).astype(np.float16).tobytes()
 
-    if col_type in NUMERIC_PACK_FORMATS:
-        fmt = NUMERIC_PACK_FORMATS[col_type]
-        return struct.pack(f"{len(values)}{fmt}", *values)
+    if col_type in NUMERIC_PACK_DTYPES:
+        # Conversion typée en un seul appel C, sans boxing par élément
+        return np.asarray(values, dtype=NUMERIC_PACK_DTYPES[col_type]).tobytes()
 
     raise ValueError(f"Type numérique inconnu: {col_type}")
 
 
+def _pack_bool(values):
+    """
+    Pack une colonne booléenne (1 bit par valeur, bit de poids faible en
+    premier). Le nombre de valeurs est inscrit dans le schéma (num_rows).
+
+    Args:
+        values: Liste de booléens
+
+    Returns:
+        bytes: Données packées
+    """
+    return np.packbits(np.asarray(values, dtype=np.bool_), bitorder="little").tobytes()
+
+
 def _pack_temporal(values, col_type):
     """
     Pack une colonne temporelle.
@@ -91,7 +117,7 @@ def _pack_temporal(values, col_type):
     else:
         raise ValueError(f"Type temporel inconnu: {col_type}")
 
-    return orjson.dumps(serialized)
+    return orjson.dumps(serialized, option=JSON_DUMPS_OPTIONS)
 
 
 def _pack_enum(values, enum_mapping):
@@ -107,7 +133,7 @@ def _pack_enum(values, enum_mapping):
     """
     # Convertir les valeurs en indices selon le mapping
     indices = [enum_mapping.get(v) for v in values]
-    return orjson.dumps(indices)
+    return orjson.dumps(indices, option=JSON_DUMPS_OPTIONS)
 
 
 def _pack_string_dict(values, string_dict):
@@ -123,7 +149,58 @@ def _pack_string_dict(values, string_dict):
     """
     # Convertir les chaînes en indices selon le dictionnaire
     indices = [string_dict.get(v) for v in values]
-    return orjson.dumps(indices)
+    return orjson.dumps(indices, option=JSON_DUMPS_OPTIONS)
+
+
+def dictionary_code_dtype(num_unique):
+    """
+    Retourne le plus petit dtype entier non signé capable de coder
+    num_unique valeurs distinctes.
+
+    Args:
+        num_unique: Nombre de valeurs distinctes
+
+    Returns:
+        type: np.uint8, np.uint16 ou np.uint32
+    """
+    if num_unique <= 1 << 8:
+        return np.uint8
+    if num_unique <= 1 << 16:
+        return np.uint16
+    return np.uint32
+
+
+def _pack_dictionary(values):
+    """
+    Pack une colonne de chaînes par dictionnaire : chaque valeur distincte
+    est stockée une seule fois, les lignes ne contiennent que son code.
+
+    Format: [u32 nb valeurs distinctes][u32 taille du dictionnaire]
+            [dictionnaire JSON (liste)][codes uint8/uint16/uint32]
+
+    Args:
+        values: Liste de chaînes
+
+    Returns:
+        bytes: Données packées
+    """
+    # dict.fromkeys conserve l'ordre de première apparition
+    mapping = dict.fromkeys(values)
+    for code, value in enumerate(mapping):
+        mapping[value] = code
+
+    dictionary = orjson.dumps(list(mapping), option=JSON_DUMPS_OPTIONS)
+    codes = np.fromiter(
+        map(mapping.__getitem__, values),
+        dtype=dictionary_code_dtype(len(mapping)),
+        count=len(values)
+    )
+    return b"".join((
+        _U32.pack(len(mapping)),
+        _U32.pack(len(dictionary)),
+        dictionary,
+        codes.tobytes(),
+    ))
 
 
 def _pack_uuid(values):
@@ -140,7 +217,7 @@ def _pack_uuid(values):
         str(v) if isinstance(v, UUID) else (v if v is None else str(v))
         for v in values
     ]
-    return orjson.dumps(serialized)
+    return orjson.dumps(serialized, option=JSON_DUMPS_OPTIONS)
 
 
 def _pack_nullable(values, base_type, **kwargs):
@@ -176,7 +253,7 @@ def _pack_nullable(values, base_type, **kwargs):
         return bytes(null_bitmap)
 
     # Packer les valeurs non-nulles selon leur type
-    if base_type in NUMERIC_PACK_FORMATS or base_type in ("float16",):
+    if base_type in NUMERIC_PACK_DTYPES:
         data_packed = _pack_numeric(non_null_values, base_type)
     elif base_type in ("date", "datetime", "timestamp_ms"):
         data_packed = _pack_temporal(non_null_values, base_type)
@@ -187,17 +264,60 @@ def _pack_nullable(values, base_type, **kwargs):
     elif base_type == "uuid":
         data_packed = _pack_uuid(non_null_values)
     elif base_type == "bool":
-        data_packed = bytes((1 if v else 0) for v in non_null_values)
+        data_packed = np.asarray(non_null_values, dtype=np.uint8).tobytes()
     elif base_type == "binary":
-        data_packed = orjson.dumps(non_null_values)
+        data_packed = orjson.dumps(non_null_values, option=JSON_DUMPS_OPTIONS)
     else:
         # string ou type inconnu
-        data_packed = orjson.dumps(non_null_values)
+        data_packed = orjson.dumps(non_null_values, option=JSON_DUMPS_OPTIONS)
 
     # Combiner bitmap + données
     return bytes(null_bitmap) + data_packed
 
 
+def detect_and_pack(values):
+    """
+    Détecte le type et packe une colonne homogène int, float ou bool en un
+    seul passage numpy, au lieu de detect_type puis pack_column.
+
+    Le type retourné est identique à celui de detect_type. Les autres
+    colonnes (None, types mixtes, chaînes, ...) ne sont pas traitées.
+
+    Args:
+        values: Liste de valeurs de la colonne
+
+    Returns:
+        tuple ou None: (col_type, blob), ou None si la colonne doit passer
+        par detect_type / pack_column. Pour les colonnes numériques, blob est
+        une vue (memoryview d'octets) sur le tableau numpy, sans copie.
+    """
+    kinds = set(map(type, values))
+    if len(kinds) != 1:
+        return None
+    kind = kinds.pop()
+
+    if kind is bool:
+        return "bool", _pack_bool(values)
+
+    if kind is int:
+        arr = np.asarray(values)
+        # Hors de int64/uint64, numpy bascule en object ou float64
+        if arr.dtype.kind not in "iu":
+            return None
+        col_type = detect_numeric_type_int(arr)
+
+    elif kind is float:
+        arr = np.asarray(values, dtype=np.float64)
+        col_type = detect_numeric_type_float(arr)
+
+    else:
+        return None
+
+    # zstd lit directement le buffer du tableau : pas de copie par tobytes()
+    packed = arr.astype(NUMERIC_PACK_DTYPES[col_type], copy=False)
+    return col_type, memoryview(packed).cast("B")
+
+
 # -----------------------------------------------------
 #   PACKING PRINCIPAL
 # -----------------------------------------------------
@@ -221,6 +341,8 @@ def pack_column(values, col_type, **kwargs):
         **kwargs: Arguments additionnels
             - enum_mapping: Dictionnaire pour les enums {value: index}
             - string_dict: Dictionnaire pour string_dict {string: index}
+            Sans mapping, enum et string_dict embarquent leur dictionnaire
+            dans le blob (voir _pack_dictionary).
 
     Returns:
         bytes: Données packées
@@ -245,29 +367,29 @@ def pack_column(values, col_type, **kwargs):
         return _pack_nullable(values, base_type, **kwargs)
 
     # Types numériques standards
-    if base_type in NUMERIC_PACK_FORMATS or base_type == "float16":
+    if base_type in NUMERIC_PACK_DTYPES:
         return _pack_numeric(values, base_type)
 
     # Booléen
     if base_type == "bool":
-        return bytes((1 if v else 0) for v in values)
+        return _pack_bool(values)
 
     # Types temporels
     if base_type in ("date", "datetime", "timestamp_ms"):
         return _pack_temporal(values, base_type)
 
-    # Enum
+    # Enum : mapping fourni (indices JSON), sinon dictionnaire inline
     if base_type == "enum":
         enum_mapping = kwargs.get("enum_mapping", {})
         if not enum_mapping:
-            raise ValueError("enum_mapping requis pour le type enum")
+            return _pack_dictionary(values)
         return _pack_enum(values, enum_mapping)
 
-    # String dict
+    # String dict : dictionnaire fourni (indices JSON), sinon dictionnaire inline
     if base_type == "string_dict":
         string_dict = kwargs.get("string_dict", {})
         if not string_dict:
-            raise ValueError("string_dict requis pour le type string_dict")
+            return _pack_dictionary(values)
         return _pack_string_dict(values, string_dict)
 
     # UUID
@@ -275,4 +397,4 @@ def pack_column(values, col_type, **kwargs):
         return _pack_uuid(values)
 
     # Binary et string (fallback JSON)
-    return orjson.dumps(values)
\ No newline at end of file
+    return orjson.dumps(values, option=JSON_DUMPS_OPTIONS)
\ No newline at end of file
@@ -1,5 +1,6 @@
 
 import uuid
+import numpy as np
 from datetime import datetime
 # -----------------------------------------------------
 #   TYPE DETECTION
@@ -18,6 +19,13 @@ UINT_RANGES = [
     ("uint64", 0, 2**64 - 1),
 ]
 
+# Bornes flottantes IEEE 754
+F16_MIN, F16_MAX = -65504, 65504
+F32_MIN, F32_MAX = -3.4e38, 3.4e38
+
+# Taille du premier bloc testé avant de vérifier toute la colonne
+F16_PROBE_SIZE = 1024
+
 def is_uuid(v):
     try:
         uuid.UUID(v)
@@ -40,8 +48,13 @@ def is_datetime(v):
         return False
 
 def detect_numeric_type_int(values):
-    min_v = min(values)
-    max_v = max(values)
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        # Réductions C sur le tableau déjà matérialisé
+        min_v = values.min().item()
+        max_v = values.max().item()
+    else:
+        min_v = min(values)
+        max_v = max(values)
 
     if min_v >= 0:
         for name, lo, hi in UINT_RANGES:
@@ -54,23 +67,24 @@ def detect_numeric_type_int(values):
 
     return "int64"
 
-def detect_numeric_type_float(values):
-    # IEEE 754
-    F16_MIN, F16_MAX = -65504, 65504
-    F32_MIN, F32_MAX = -3.4e38, 3.4e38
-
-    fits_f16 = True
-    fits_f32 = True
+def _has_three_decimals(arr):
+    # Les premières valeurs d'abord : une colonne de flottants quelconques
+    # échoue dès ce bloc, sans arrondir tout le tableau
+    head = arr[:F16_PROBE_SIZE]
+    if not np.array_equal(np.round(head, 3), head):
+        return False
+    tail = arr[F16_PROBE_SIZE:]
+    return np.array_equal(np.round(tail, 3), tail)
 
-    for v in values:
-        if not (F16_MIN <= v <= F16_MAX) or round(v, 3) != v:
-            fits_f16 = False
-        if not (F32_MIN <= v <= F32_MAX):
-            fits_f32 = False
+def detect_numeric_type_float(values):
+    # Tests vectorisés : un NaN fait échouer les comparaisons, comme en Python
+    arr = np.asarray(values, dtype=np.float64)
+    lo, hi = arr.min(), arr.max()
 
-    if fits_f16:
+    # Dans la plage float16, np.round(v, 3) == v équivaut à round(v, 3) == v
+    if F16_MIN <= lo and hi <= F16_MAX and _has_three_decimals(arr):
         return "float16"
-    if fits_f32:
+    if F32_MIN <= lo and hi <= F32_MAX:
         return "float32"
     return "float64"
 
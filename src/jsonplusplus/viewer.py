@@ -15,10 +15,12 @@ from pathlib import Path
 import threading
 from typing import Optional, List, Dict, Any
 import csv
-import json
+import os
+import orjson
 import subprocess
 import platform
 import shutil
+import numpy as np
 
 from . import JONXFile, JONXError
 
@@ -467,13 +469,15 @@ class JONXViewer(ctk.CTk):
                     
                     # Charger les données
                     result = self.jonx_file.get_columns(self.jonx_file.fields)
+                    # Colonnes numériques -> valeurs Python pour l'affichage et l'export
+                    result = {
+                        field: col.tolist() if isinstance(col, np.ndarray) else col
+                        for field, col in result.items()
+                    }
                     
-                    # Reconstruire les données ligne par ligne
-                    num_rows = len(result[self.jonx_file.fields[0]]) if self.jonx_file.fields else 0
-                    data = []
-                    for i in range(num_rows):
-                        row = {field: result[field][i] for field in self.jonx_file.fields}
-                        data.append(row)
+                    # Reconstruire les données ligne par ligne en un seul passage
+                    fields = tuple(self.jonx_file.fields)
+                    data = [dict(zip(fields, row)) for row in zip(*(result[f] for f in fields))]
                     
                     # Mettre à jour l'UI dans le thread principal
                     self.after(0, lambda: self.on_file_loaded(info, data))
@@ -610,7 +614,7 @@ class JONXViewer(ctk.CTk):
             if self.jonx_file.is_numeric(field):
                 try:
                     col = self.jonx_file.get_column(field)
-                    if col:
+                    if len(col) > 0:
                         min_val = self.jonx_file.find_min(field, use_index=True)
                         max_val = self.jonx_file.find_max(field, use_index=True)
                         avg_val = self.jonx_file.avg(field)
@@ -714,8 +718,12 @@ class JONXViewer(ctk.CTk):
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.filtered_data, f, indent=2, ensure_ascii=False)
+                # orjson sérialise nativement date, datetime, UUID et scalaires numpy
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        self.filtered_data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                    ))
                 
                 messagebox.showinfo("Succès", f"Données exportées vers {file_path}")
             except Exception as e:
@@ -749,8 +757,6 @@ def main(initial_file: Optional[str] = None):
     Args:
         initial_file: Chemin vers un fichier JONX à ouvrir automatiquement (optionnel)
     """
-    import os
-    
     # Vérifier si un fichier est passé via variable d'environnement
     if not initial_file:
         initial_file = os.environ.get('JONX_VIEWER_FILE')